@@ -44,5 +44,5 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
     install_requires=["six>=1.9.0"],
-    extras_require={"gmpy2": "gmpy2", "gmpy": "gmpy"},
+    extras_require={"gmpy2": "gmpy2"},
 )
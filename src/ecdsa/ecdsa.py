@@ -110,23 +110,29 @@ class Signature(object):
         x = r
 
         # Compute the curve point with x as x-coordinate
-        alpha = (
-            pow(x, 3, curve.p()) + (curve.a() * x) + curve.b()
-        ) % curve.p()
-        beta = numbertheory.square_root_mod_prime(alpha, curve.p())
-        y = beta if beta % 2 == 0 else curve.p() - beta
-
-        # Compute the public key
-        R1 = ellipticcurve.PointJacobi(curve, x, y, 1, n)
-        Q1 = numbertheory.inverse_mod(r, n) * (s * R1 + (-e % n) * generator)
-        Pk1 = Public_key(generator, Q1)
-
-        # And the second solution
-        R2 = ellipticcurve.PointJacobi(curve, x, -y, 1, n)
-        Q2 = numbertheory.inverse_mod(r, n) * (s * R2 + (-e % n) * generator)
-        Pk2 = Public_key(generator, Q2)
-
-        return [Pk1, Pk2]
+        p = curve.p()
+        alpha = ((x * x % p + curve.a()) * x + curve.b()) % p
+        beta = numbertheory.square_root_mod_prime(alpha, p)
+        y = beta if beta % 2 == 0 else p - beta
+
+        # Compute the public key: Q = r^-1 * (s * R - e * G),
+        # i.e. u1 * G + u2 * R, where both multiplications can share
+        # the point doublings
+        r_inv = numbertheory.inverse_mod(r, n)
+        u1 = (-e * r_inv) % n
+        u2 = (s * r_inv) % n
+
+        pks = []
+        # the second solution uses R with negated y coordinate
+        for coord_y in (y, -y):
+            R = ellipticcurve.PointJacobi(curve, x, coord_y, 1, n)
+            if hasattr(generator, "mul_add"):
+                Q = generator.mul_add(u1, R, u2)
+            else:
+                Q = u1 * generator + u2 * R
+            pks.append(Public_key(generator, Q))
+
+        return pks
 
 
 class Public_key(object):
@@ -655,8 +661,18 @@ _p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 _Gx = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
 _Gy = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
 _r = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
-
-curve_secp256k1 = ellipticcurve.CurveFp(_p, _a, _b, 1)
+# parameters of the GLV endomorphism, see Gallant, Lambert, Vanstone,
+# "Faster Point Multiplication on Elliptic Curves with Efficient
+# Endomorphisms"
+_lam = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+_beta = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+_a1 = 0x3086D221A7D46BCDE86C90E49284EB15
+_b1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+_a2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+
+curve_secp256k1 = ellipticcurve.CurveFp(
+    _p, _a, _b, 1, glv=(_r, _lam, _beta, _a1, _b1, _a2, _a1)
+)
 generator_secp256k1 = ellipticcurve.PointJacobi(
     curve_secp256k1, _Gx, _Gy, 1, _r, generator=True
 )
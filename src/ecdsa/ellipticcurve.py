@@ -35,23 +35,159 @@
 from __future__ import division
 
 try:
-    from gmpy2 import mpz
+    from gmpy2 import mpz, invert
 
     GMPY = True
 except ImportError:  # pragma: no branch
-    try:
-        from gmpy import mpz
+    GMPY = False
 
-        GMPY = True
-    except ImportError:
-        GMPY = False
 
+if GMPY:  # pragma: no branch
+    # in old gmpy2 versions mpz is a factory function, not the type
+    _MPZ_TYPE = type(mpz(1))
 
+
+from collections import deque
+from threading import Lock
 from six import python_2_unicode_compatible
 from . import numbertheory
-from ._compat import normalise_bytes, int_to_bytes, bit_length, bytes_to_int
+from ._compat import (
+    normalise_bytes,
+    int_to_bytes,
+    bit_length,
+    bytes_to_int,
+    str_idx_as_int,
+)
 from .errors import MalformedPointError
-from .util import orderlen, string_to_number, number_to_string
+from .util import orderlen, number_to_string
+
+
+_ALL_ENCODINGS = frozenset(("uncompressed", "compressed", "hybrid", "raw"))
+
+# the X9.62 uncompressed and hybrid encodings have the same length,
+# they differ only in the first byte
+_X962_FORMATS = {4: "uncompressed", 6: "hybrid", 7: "hybrid"}
+
+
+def _jsf_step(d0, d1, l0, l1):
+    """
+    Calculate one column of joint sparse form.
+
+    Follows the loop body of Algorithm 3.50 from "Guide to Elliptic Curve
+    Cryptography" (Hankerson, Menezes, Vanstone), d0 and d1 are the carries,
+    l0 and l1 are the three least significant bits of the numbers.
+    Returns the digit pair and the carries of the next step.
+    """
+    l0 += d0
+    l1 += d1
+    if l0 & 1:
+        # l0 mods 4
+        u0 = 2 - (l0 & 3)
+        if l0 & 7 in (3, 5) and l1 & 3 == 2:
+            u0 = -u0
+    else:
+        u0 = 0
+    if l1 & 1:
+        u1 = 2 - (l1 & 3)
+        if l1 & 7 in (3, 5) and l0 & 3 == 2:
+            u1 = -u1
+    else:
+        u1 = 0
+    if 2 * d0 == 1 + u0:
+        d0 = 1 - d0
+    if 2 * d1 == 1 + u1:
+        d1 = 1 - d1
+    return (u0, u1), d0 << 7 | d1 << 6
+
+
+# every step of the JSF calculation depends only on the two carries and the
+# three least significant bits of both numbers, so precompute all of them,
+# the index is d0 << 7 | d1 << 6 | l0 << 3 | l1
+_JSF_TABLE = [
+    _jsf_step(i >> 7, (i >> 6) & 1, (i >> 3) & 7, i & 7) for i in range(256)
+]
+
+
+def _batch_inverse(values, p):
+    """
+    Calculate the modular inverses of all the values.
+
+    Uses Montgomery's trick, so the whole list needs a single modular
+    inverse and three multiplications per value.
+    None of the values can be zero modulo p.
+
+    :param list values: the integers to invert
+    :param int p: the field prime
+    :return: list of inverses of the values, in the same order
+    """
+    # partial products of the values: acc[i] = v_0 * ... * v_i
+    acc = []
+    prod = 1
+    for value in values:
+        prod = prod * value % p
+        acc.append(prod)
+
+    inv = numbertheory.inverse_mod(prod, p)
+    ret = [None] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        # inv == (v_0 * ... * v_i)^-1
+        ret[i] = inv * acc[i - 1] % p
+        inv = inv * values[i] % p
+    if values:
+        ret[0] = inv
+    return ret
+
+
+class _PrecomputeCache(object):
+    """
+    Bounded, thread-safe cache of point multiplication tables.
+
+    Allows different instances of the same point (e.g. a public key decoded
+    again for every verified signature) to share a precomputation table.
+    When full, the least recently used table is evicted.
+    """
+
+    def __init__(self, size):
+        self.__size = size
+        self.__tables = {}
+        self.__keys = deque()
+        self.__lock = Lock()
+
+    def get(self, key):
+        """Return the table stored for key or None if there is none."""
+        with self.__lock:
+            table = self.__tables.get(key)
+            if table is not None:
+                self.__keys.remove(key)
+                self.__keys.append(key)
+            return table
+
+    def put(self, key, table):
+        """
+        Store the table for key.
+
+        Returns the table already stored for key if another thread was
+        faster, the passed in table otherwise.
+        """
+        with self.__lock:
+            old = self.__tables.get(key)
+            if old is not None:
+                return old
+            if len(self.__keys) >= self.__size:
+                del self.__tables[self.__keys.popleft()]
+            self.__tables[key] = table
+            self.__keys.append(key)
+            return table
+
+    def __len__(self):
+        return len(self.__tables)
+
+
+# with the odd multiples of the width-5 NAF the tables are big (close to
+# a megabyte for P-256 and up to 2 megabytes for P-521), so keep just a few
+# of them around; the tables of the curve generators are kept by the
+# generators themselves anyway
+_PRECOMPUTE_CACHE = _PrecomputeCache(4)
 
 
 @python_2_unicode_compatible
@@ -61,9 +197,13 @@ class CurveFp(object):
     prime field.
     """
 
+    # curves unpickled from older versions don't have the endomorphism
+    # parameters set
+    _glv = None
+
     if GMPY:  # pragma: no branch
 
-        def __init__(self, p, a, b, h=None):
+        def __init__(self, p, a, b, h=None, glv=None):
             """
             The curve of points satisfying y^2 = x^3 + a*x + b (mod p).
 
@@ -71,17 +211,30 @@ class CurveFp(object):
             parameters; it is the number of points satisfying the elliptic
             curve equation divided by the order of the base point. It is used
             for selection of efficient algorithm for public point verification.
+
+            glv are the parameters of the efficiently computable endomorphism
+            of the curve, if it has one (like secp256k1 does), as a tuple
+            (n, lam, beta, a1, b1, a2, b2): n is the order of the curve,
+            lam * (x, y) == (beta * x, y) and (a1, b1), (a2, b2) are short
+            vectors of the lattice of (k1, k2) such that k1 + k2 * lam == 0
+            (mod n). The endomorphism is used to speed up multiplication.
             """
             self.__p = mpz(p)
-            self.__a = mpz(a)
-            self.__b = mpz(b)
+            # keep the parameters reduced, so that equal curves compare
+            # and hash equal without any further reductions
+            self.__a = mpz(a) % self.__p
+            self.__b = mpz(b) % self.__p
             # h is not used in calculations and it can be None, so don't use
             # gmpy with it
             self.__h = h
+            # NIST (and twisted Brainpool) curves use a == -3, that allows
+            # for faster point doubling
+            self._a_is_minus_3 = (self.__a + 3) % self.__p == 0
+            self._glv = glv and tuple(mpz(i) for i in glv)
 
     else:  # pragma: no branch
 
-        def __init__(self, p, a, b, h=None):
+        def __init__(self, p, a, b, h=None, glv=None):
             """
             The curve of points satisfying y^2 = x^3 + a*x + b (mod p).
 
@@ -89,11 +242,32 @@ class CurveFp(object):
             parameters; it is the number of points satisfying the elliptic
             curve equation divided by the order of the base point. It is used
             for selection of efficient algorithm for public point verification.
+
+            glv are the parameters of the efficiently computable endomorphism
+            of the curve, if it has one (like secp256k1 does), as a tuple
+            (n, lam, beta, a1, b1, a2, b2): n is the order of the curve,
+            lam * (x, y) == (beta * x, y) and (a1, b1), (a2, b2) are short
+            vectors of the lattice of (k1, k2) such that k1 + k2 * lam == 0
+            (mod n). The endomorphism is used to speed up multiplication.
             """
             self.__p = p
-            self.__a = a
-            self.__b = b
+            # keep the parameters reduced, so that equal curves compare
+            # and hash equal without any further reductions
+            self.__a = a % p
+            self.__b = b % p
             self.__h = h
+            # NIST (and twisted Brainpool) curves use a == -3, that allows
+            # for faster point doubling
+            self._a_is_minus_3 = (a + 3) % p == 0
+            self._glv = glv
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # pickles created by older versions don't include the derived values
+        # and may have the parameters unreduced
+        self.__a = self.__a % self.__p
+        self.__b = self.__b % self.__p
+        self._a_is_minus_3 = (self.__a + 3) % self.__p == 0
 
     def __eq__(self, other):
         """Return True if other is an identical curve, False otherwise.
@@ -104,11 +278,10 @@ class CurveFp(object):
         only the prime and curve parameters are considered.
         """
         if isinstance(other, CurveFp):
-            p = self.__p
             return (
                 self.__p == other.__p
-                and self.__a % p == other.__a % p
-                and self.__b % p == other.__b % p
+                and self.__a == other.__a
+                and self.__b == other.__b
             )
         return NotImplemented
 
@@ -164,9 +337,13 @@ class CurveEdTw(object):
              (like SHA-512 for Ed25519)
             """
             self.__p = mpz(p)
-            self.__a = mpz(a)
-            self.__d = mpz(d)
+            # keep the parameters reduced, so that equal curves compare
+            # and hash equal without any further reductions
+            self.__a = mpz(a) % self.__p
+            self.__d = mpz(d) % self.__p
             self.__h = h
+            # Ed25519 uses a == -1, that allows for faster point doubling
+            self._a_is_minus_1 = self.__a == self.__p - 1
             self.__hash_func = hash_func
 
     else:
@@ -180,19 +357,30 @@ class CurveEdTw(object):
              (like SHA-512 for Ed25519)
             """
             self.__p = p
-            self.__a = a
-            self.__d = d
+            # keep the parameters reduced, so that equal curves compare
+            # and hash equal without any further reductions
+            self.__a = a % p
+            self.__d = d % p
             self.__h = h
+            # Ed25519 uses a == -1, that allows for faster point doubling
+            self._a_is_minus_1 = self.__a == p - 1
             self.__hash_func = hash_func
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # pickles created by older versions don't include the derived values
+        # and may have the parameters unreduced
+        self.__a = self.__a % self.__p
+        self.__d = self.__d % self.__p
+        self._a_is_minus_1 = self.__a == self.__p - 1
+
     def __eq__(self, other):
         """Returns True if other is an identical curve."""
         if isinstance(other, CurveEdTw):
-            p = self.__p
             return (
                 self.__p == other.__p
-                and self.__a % p == other.__a % p
-                and self.__d % p == other.__d % p
+                and self.__a == other.__a
+                and self.__d == other.__d
             )
         return NotImplemented
 
@@ -205,9 +393,9 @@ class CurveEdTw(object):
 
     def contains_point(self, x, y):
         """Is the point (x, y) on this curve?"""
-        return (
-            self.__a * x * x + y * y - 1 - self.__d * x * x * y * y
-        ) % self.__p == 0
+        xx = x * x
+        yy = y * y
+        return (self.__a * xx + yy - 1 - self.__d * xx * yy) % self.__p == 0
 
     def p(self):
         return self.__p
@@ -242,6 +430,8 @@ class CurveEdTw(object):
 class AbstractPoint(object):
     """Class for common methods of elliptic curve points."""
 
+    __slots__ = ()
+
     @staticmethod
     def _from_raw_encoding(data, raw_encoding_length):
         """
@@ -258,21 +448,24 @@ class AbstractPoint(object):
         # integer by two so it will always be even
         assert len(xs) == raw_encoding_length // 2
         assert len(ys) == raw_encoding_length // 2
-        coord_x = string_to_number(xs)
-        coord_y = string_to_number(ys)
+        coord_x = bytes_to_int(xs, "big")
+        coord_y = bytes_to_int(ys, "big")
 
         return coord_x, coord_y
 
     @staticmethod
     def _from_compressed(data, curve):
         """Decode public point from compressed encoding."""
-        if data[:1] not in (b"\x02", b"\x03"):
+        # compare integers, not one byte long slices of the buffer
+        fmt = str_idx_as_int(data, 0)
+        if fmt not in (2, 3):
             raise MalformedPointError("Malformed compressed point encoding")
 
-        is_even = data[:1] == b"\x02"
-        x = string_to_number(data[1:])
+        is_even = fmt == 2
+        x = bytes_to_int(data[1:], "big")
         p = curve.p()
-        alpha = (pow(x, 3, p) + (curve.a() * x) + curve.b()) % p
+        # x^3 + a*x + b == (x^2 + a)*x + b
+        alpha = ((x * x % p + curve.a()) * x + curve.b()) % p
         try:
             beta = numbertheory.square_root_mod_prime(alpha, p)
         except numbertheory.Error as e:
@@ -288,19 +481,16 @@ class AbstractPoint(object):
     @classmethod
     def _from_hybrid(cls, data, raw_encoding_length, validate_encoding):
         """Decode public point from hybrid encoding."""
+        fmt = str_idx_as_int(data, 0)
         # real assert, from_bytes() should not call us with different types
-        assert data[:1] in (b"\x06", b"\x07")
+        assert fmt in (6, 7)
 
         # primarily use the uncompressed as it's easiest to handle
         x, y = cls._from_raw_encoding(data[1:], raw_encoding_length)
 
-        # but validate if it's self-consistent if we're asked to do that
-        if validate_encoding and (
-            y & 1
-            and data[:1] != b"\x07"
-            or (not y & 1)
-            and data[:1] != b"\x06"
-        ):
+        # but validate if it's self-consistent if we're asked to do that,
+        # 0x06 is used for even y, 0x07 for odd
+        if validate_encoding and fmt != 6 + (y & 1):
             raise MalformedPointError("Inconsistent hybrid point encoding")
 
         return x, y
@@ -375,17 +565,14 @@ class AbstractPoint(object):
         :rtype: tuple(int, int)
         """
         if not valid_encodings:
-            valid_encodings = set(
-                ["uncompressed", "compressed", "hybrid", "raw"]
-            )
-        if not all(
-            i in set(("uncompressed", "compressed", "hybrid", "raw"))
-            for i in valid_encodings
-        ):
+            valid_encodings = _ALL_ENCODINGS
+        if not _ALL_ENCODINGS.issuperset(valid_encodings):
             raise ValueError(
                 "Only uncompressed, compressed, hybrid or raw encoding "
                 "supported."
             )
+        # on Python 3 this is a memoryview, so all the slicing below
+        # doesn't copy the data
         data = normalise_bytes(data)
 
         if isinstance(curve, CurveEdTw):
@@ -400,18 +587,19 @@ class AbstractPoint(object):
         elif key_len == raw_encoding_length + 1 and (
             "hybrid" in valid_encodings or "uncompressed" in valid_encodings
         ):
-            if data[:1] in (b"\x06", b"\x07") and "hybrid" in valid_encodings:
+            encoding = _X962_FORMATS.get(str_idx_as_int(data, 0))
+            if encoding not in valid_encodings:
+                raise MalformedPointError(
+                    "Invalid X9.62 encoding of the public point"
+                )
+            if encoding == "hybrid":
                 coord_x, coord_y = cls._from_hybrid(
                     data, raw_encoding_length, validate_encoding
                 )
-            elif data[:1] == b"\x04" and "uncompressed" in valid_encodings:
+            else:
                 coord_x, coord_y = cls._from_raw_encoding(
                     data[1:], raw_encoding_length
                 )
-            else:
-                raise MalformedPointError(
-                    "Invalid X9.62 encoding of the public point"
-                )
         elif (
             key_len == raw_encoding_length // 2 + 1
             and "compressed" in valid_encodings
@@ -487,19 +675,49 @@ class AbstractPoint(object):
             return self._compressed_encode()
 
     @staticmethod
-    def _naf(mult):
-        """Calculate non-adjacent form of number."""
+    def _wnaf(mult, width):
+        """Calculate width-w non-adjacent form of a non-negative number.
+
+        All non-zero digits are odd and lay in the range
+        [-(2^(width-1) - 1), 2^(width-1) - 1], least significant digit first.
+        """
         ret = []
+        window = 1 << width
+        mask = window - 1
+        half = window >> 1
+        # after a non-zero digit the next width - 1 digits are zero
+        zeros = [0] * (width - 1)
         while mult:
-            if mult % 2:
-                nd = mult % 4
-                if nd >= 2:
-                    nd -= 4
+            if mult & 1:
+                nd = mult & mask
+                if nd >= half:
+                    nd -= window
                 ret.append(nd)
                 mult -= nd
+                if not mult:
+                    break
+                ret += zeros
+                mult >>= width
             else:
                 ret.append(0)
-            mult //= 2
+                mult >>= 1
+        return ret
+
+    @staticmethod
+    def _jsf(mult0, mult1):
+        """Calculate joint sparse form of two non-negative numbers.
+
+        Returns list of (u0, u1) digit pairs, least significant first, where
+        all digits are -1, 0 or 1 and on average only half of the pairs have
+        a non-zero digit (the minimum among all joint signed representations).
+        """
+        ret = []
+        state = 0
+        while mult0 or mult1 or state:
+            pair, state = _JSF_TABLE[state | (mult0 & 7) << 3 | mult1 & 7]
+            ret.append(pair)
+            mult0 >>= 1
+            mult1 >>= 1
         return ret
 
 
@@ -514,6 +732,16 @@ class PointJacobi(AbstractPoint):
     y = Y / Z³
     """
 
+    # the coordinates are kept in a single tuple, not in separate slots, so
+    # that scale() can replace all of them with one atomic assignment
+    __slots__ = (
+        "__curve",
+        "__coords",
+        "__order",
+        "__generator",
+        "__precompute",
+    )
+
     def __init__(self, curve, x, y, z, order=None, generator=False):
         """
         Initialise a point that uses Jacobi representation internally.
@@ -534,7 +762,13 @@ class PointJacobi(AbstractPoint):
         super(PointJacobi, self).__init__()
         self.__curve = curve
         if GMPY:  # pragma: no branch
-            self.__coords = (mpz(x), mpz(y), mpz(z))
+            # coordinates coming from point arithmetic already are mpz
+            # objects, don't spend time on wrapping them again
+            self.__coords = (
+                x if type(x) is _MPZ_TYPE else mpz(x),
+                y if type(y) is _MPZ_TYPE else mpz(y),
+                z if type(z) is _MPZ_TYPE else mpz(z),
+            )
             self.__order = order and mpz(order)
         else:  # pragma: no branch
             self.__coords = (x, y, z)
@@ -600,31 +834,85 @@ class PointJacobi(AbstractPoint):
         # lead to inconsistent __precompute)
         order = self.__order
         assert order
+        p, a = self.__curve.p(), self.__curve.a()
+        X, Y, Z = self.scale().__coords
+        # the table depends only on the field, the doubling formula
+        # and the point itself
+        key = (p, a, X, Y, order)
+        precompute = _PRECOMPUTE_CACHE.get(key)
+        if precompute is not None:
+            self.__precompute = precompute
+            return
+
+        _double = self._doubler()
+        _add = self._add
+        # the multiplier is reduced modulo 2*order (see __mul__), so its
+        # width-5 NAF has at most bit_length(2*order) + 1 digits, for every
+        # digit position i we need the odd multiples u * 2^i * G, u in 1..15
+        rows = bit_length(order * 2) + 1
+        points = []
+
+        for _ in range(rows):
+            # 2 * base is also the base of the next row
+            X2, Y2, Z2 = _double(X, Y, Z, p, a)
+            X3, Y3, Z3 = X, Y, Z
+            points.append((X3, Y3, Z3))
+            for _ in range(7):
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X2, Y2, Z2, p)
+                points.append((X3, Y3, Z3))
+            X, Y, Z = X2, Y2, Z2
+
+        # convert the table to affine coordinates so that all the additions
+        # in _mul_precompute() are the cheap mixed additions
+        points = self._batch_affine(points, p)
+        # store the negated points at negative indexes, so that a width-5
+        # NAF digit can be used directly as an index to a row
         precompute = []
-        i = 1
-        order *= 2
-        coord_x, coord_y, coord_z = self.__coords
-        doubler = PointJacobi(self.__curve, coord_x, coord_y, coord_z, order)
-        order *= 2
-        precompute.append((doubler.x(), doubler.y()))
-
-        while i < order:
-            i *= 2
-            doubler = doubler.double().scale()
-            precompute.append((doubler.x(), doubler.y()))
+        for i in range(0, len(points), 8):
+            row = [None] * 32
+            for u, (x, y) in zip(range(1, 16, 2), points[i : i + 8]):
+                row[u], row[-u] = (x, y), (x, p - y)
+            precompute.append(row)
 
-        self.__precompute = precompute
+        self.__precompute = _PRECOMPUTE_CACHE.put(key, precompute)
+
+    @staticmethod
+    def _batch_affine(points, p):
+        """
+        Convert a list of points in Jacobi coordinates to affine coordinates.
+
+        Uses _batch_inverse(), so the whole conversion needs a single
+        modular inverse and a few multiplications per point.
+        None of the points can be the point at infinity.
+
+        :param list points: list of (X, Y, Z) tuples
+        :param int p: the field prime
+        :return: list of (x, y) tuples
+        """
+        z_invs = _batch_inverse([Z for _, _, Z in points], p)
+        ret = []
+        for (X, Y, _), z_inv in zip(points, z_invs):
+            zz_inv = z_inv * z_inv % p
+            ret.append((X * zz_inv % p, Y * zz_inv * z_inv % p))
+        return ret
 
     def __getstate__(self):
-        # while this code can execute at the same time as _maybe_precompute()
-        # is updating the __precompute or scale() is updating the __coords,
-        # there is no requirement for consistency between __coords and
-        # __precompute
-        state = self.__dict__.copy()
-        return state
+        # the precomputation table is large and easy to recreate, so it
+        # isn't pickled, the point will compute it (or get it from the
+        # cache) on first use
+        return {
+            "_PointJacobi__curve": self.__curve,
+            "_PointJacobi__coords": self.__coords,
+            "_PointJacobi__order": self.__order,
+            "_PointJacobi__generator": self.__generator,
+        }
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        for name, value in state.items():
+            # older versions did pickle the table, in a different layout
+            if name != "_PointJacobi__precompute":
+                setattr(self, name, value)
+        self.__precompute = []
 
     def __eq__(self, other):
         """Compare for equality two points with each-other.
@@ -644,6 +932,16 @@ class PointJacobi(AbstractPoint):
             return False
         p = self.__curve.p()
 
+        # all points with Z == 0 are the point at infinity, whatever their
+        # X and Y coordinates, so they need to be handled before the check
+        # below
+        if not z1 or not z2:
+            return not z1 and not z2
+
+        # common for points both in affine or with the same scaling
+        if z1 == z2:
+            return (x1 - x2) % p == 0 and (y1 - y2) % p == 0
+
         zz1 = z1 * z1 % p
         zz2 = z2 * z2 % p
 
@@ -682,8 +980,11 @@ class PointJacobi(AbstractPoint):
         if z == 1:
             return x
         p = self.__curve.p()
-        z = numbertheory.inverse_mod(z, p)
-        return x * z**2 % p
+        if GMPY:  # pragma: no branch
+            z = invert(z, p) if z else 0
+        else:  # pragma: no branch
+            z = numbertheory.inverse_mod(z, p)
+        return x * z * z % p
 
     def y(self):
         """
@@ -698,8 +999,11 @@ class PointJacobi(AbstractPoint):
         if z == 1:
             return y
         p = self.__curve.p()
-        z = numbertheory.inverse_mod(z, p)
-        return y * z**3 % p
+        if GMPY:  # pragma: no branch
+            z = invert(z, p) if z else 0
+        else:  # pragma: no branch
+            z = numbertheory.inverse_mod(z, p)
+        return y * (z * z % p) * z % p
 
     def scale(self):
         """
@@ -714,7 +1018,10 @@ class PointJacobi(AbstractPoint):
         # scaling is deterministic, so even if two threads execute the below
         # code at the same time, they will set __coords to the same value
         p = self.__curve.p()
-        z_inv = numbertheory.inverse_mod(z, p)
+        if GMPY:  # pragma: no branch
+            z_inv = invert(z, p) if z else 0
+        else:  # pragma: no branch
+            z_inv = numbertheory.inverse_mod(z, p)
         zz_inv = z_inv * z_inv % p
         x = x * zz_inv % p
         y = y * zz_inv * z_inv % p
@@ -760,8 +1067,11 @@ class PointJacobi(AbstractPoint):
         XX, YY = X1 * X1 % p, Y1 * Y1 % p
         if not YY:
             return 0, 0, 1
-        YYYY = YY * YY % p
-        S = 2 * ((X1 + YY) ** 2 - XX - YYYY) % p
+        # YYYY is only subtracted before the reduction of Y3 so it doesn't
+        # need to be reduced here
+        YYYY = YY * YY
+        # 2 * ((X1 + YY)^2 - XX - YYYY) == 4 * X1 * YY
+        S = 4 * X1 * YY % p
         M = 3 * XX + a
         T = (M * M - 2 * S) % p
         # X3 = T
@@ -777,20 +1087,87 @@ class PointJacobi(AbstractPoint):
             return 0, 0, 1
         # after:
         # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#doubling-dbl-2007-bl
-        XX, YY = X1 * X1 % p, Y1 * Y1 % p
+        # XX and YYYY are only added or subtracted before the reduction of
+        # M and Y3 so they don't need to be reduced here
+        XX, YY = X1 * X1, Y1 * Y1 % p
         if not YY:
             return 0, 0, 1
-        YYYY = YY * YY % p
+        YYYY = YY * YY
         ZZ = Z1 * Z1 % p
-        S = 2 * ((X1 + YY) ** 2 - XX - YYYY) % p
+        # 2 * ((X1 + YY)^2 - XX - YYYY) == 4 * X1 * YY
+        S = 4 * X1 * YY % p
         M = (3 * XX + a * ZZ * ZZ) % p
         T = (M * M - 2 * S) % p
         # X3 = T
         Y3 = (M * (S - T) - 8 * YYYY) % p
-        Z3 = ((Y1 + Z1) ** 2 - YY - ZZ) % p
+        # (Y1 + Z1)^2 - YY - ZZ == 2 * Y1 * Z1
+        Z3 = 2 * Y1 * Z1 % p
 
         return T, Y3, Z3
 
+    def _double_a_m3(self, X1, Y1, Z1, p, a):
+        """Add a point to itself, arbitrary z, curve with a == -3."""
+        if Z1 == 1:
+            return self._double_with_z_1(X1, Y1, p, a)
+        if not Y1 or not Z1:
+            return 0, 0, 1
+        # after:
+        # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-3.html#doubling-dbl-2001-b
+        delta = Z1 * Z1 % p
+        gamma = Y1 * Y1 % p
+        if not gamma:
+            return 0, 0, 1
+        beta = X1 * gamma % p
+        # 3 * X1^2 + a * Z1^4 with a == -3
+        alpha = 3 * (X1 - delta) * (X1 + delta) % p
+        X3 = (alpha * alpha - 8 * beta) % p
+        Y3 = (alpha * (4 * beta - X3) - 8 * gamma * gamma) % p
+        # (Y1 + Z1)^2 - gamma - delta == 2 * Y1 * Z1
+        Z3 = 2 * Y1 * Z1 % p
+
+        return X3, Y3, Z3
+
+    def _double_a_0(self, X1, Y1, Z1, p, a):
+        """Add a point to itself, arbitrary z, curve with a == 0."""
+        if Z1 == 1:
+            return self._double_with_z_1(X1, Y1, p, a)
+        if not Y1 or not Z1:
+            return 0, 0, 1
+        # after:
+        # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html#doubling-dbl-2009-l
+        A, B = X1 * X1, Y1 * Y1 % p
+        if not B:
+            return 0, 0, 1
+        # C is only subtracted before the reduction of Y3 so it doesn't
+        # need to be reduced here
+        C = B * B
+        # 2 * ((X1 + B)^2 - A - C) == 4 * X1 * B
+        D = 4 * X1 * B % p
+        E = 3 * A % p
+        X3 = (E * E - 2 * D) % p
+        Y3 = (E * (D - X3) - 8 * C) % p
+        # (Y1 + Z1)^2 - B - Z1^2 == 2 * Y1 * Z1
+        Z3 = 2 * Y1 * Z1 % p
+
+        return X3, Y3, Z3
+
+    def _doubler(self):
+        """Return the fastest doubling method for the curve of the point."""
+        if self.__curve._a_is_minus_3:
+            return self._double_a_m3
+        if not self.__curve.a():
+            return self._double_a_0
+        return self._double
+
+    def _double_adder(self):
+        """
+        Return the fastest fused doubling and mixed addition method for
+        the curve of the point.
+        """
+        if self.__curve._a_is_minus_3:
+            return self._double_add_mixed_a_m3
+        return self._double_add_mixed
+
     def double(self):
         """Add a point to itself."""
         X1, Y1, Z1 = self.__coords
@@ -800,7 +1177,7 @@ class PointJacobi(AbstractPoint):
 
         p, a = self.__curve.p(), self.__curve.a()
 
-        X3, Y3, Z3 = self._double(X1, Y1, Z1, p, a)
+        X3, Y3, Z3 = self._doubler()(X1, Y1, Z1, p, a)
 
         if not Y3 or not Z3:
             return INFINITY
@@ -818,7 +1195,7 @@ class PointJacobi(AbstractPoint):
         if not H and not r:
             return self._double_with_z_1(X1, Y1, p, self.__curve.a())
         V = X1 * I
-        X3 = (r**2 - J - 2 * V) % p
+        X3 = (r * r - J - 2 * V) % p
         Y3 = (r * (V - X3) - 2 * Y1 * J) % p
         Z3 = 2 * H % p
         return X3, Y3, Z3
@@ -827,26 +1204,35 @@ class PointJacobi(AbstractPoint):
         """add points when Z1 == Z2"""
         # after:
         # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-zadd-2007-m
-        A = (X2 - X1) ** 2 % p
+        H = X2 - X1
+        R = Y2 - Y1
+        A = H * H % p
         B = X1 * A % p
         C = X2 * A
-        D = (Y2 - Y1) ** 2 % p
+        D = R * R % p
         if not A and not D:
             return self._double(X1, Y1, Z1, p, self.__curve.a())
         X3 = (D - B - C) % p
-        Y3 = ((Y2 - Y1) * (B - X3) - Y1 * (C - B)) % p
-        Z3 = Z1 * (X2 - X1) % p
+        Y3 = (R * (B - X3) - Y1 * (C - B)) % p
+        Z3 = Z1 * H % p
         return X3, Y3, Z3
 
-    def _add_with_z2_1(self, X1, Y1, Z1, X2, Y2, p):
-        """add points when Z2 == 1"""
+    def _add_mixed(self, X1, Y1, Z1, X2, Y2, p):
+        """
+        add point in Jacobi coordinates to an affine point (Z2 == 1)
+
+        (X2, Y2) must not be the point at infinity
+        """
+        if not Y1 or not Z1:
+            return X2, Y2, 1
         # after:
         # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-madd-2007-bl
         Z1Z1 = Z1 * Z1 % p
-        U2, S2 = X2 * Z1Z1 % p, Y2 * Z1 * Z1Z1 % p
+        # U2 and S2 are reduced as part of H and r
+        U2, S2 = X2 * Z1Z1, Y2 * Z1 * Z1Z1
         H = (U2 - X1) % p
         HH = H * H % p
-        I = 4 * HH % p
+        I = 4 * HH
         J = H * I
         r = 2 * (S2 - Y1) % p
         if not r and not H:
@@ -854,7 +1240,100 @@ class PointJacobi(AbstractPoint):
         V = X1 * I
         X3 = (r * r - J - 2 * V) % p
         Y3 = (r * (V - X3) - 2 * Y1 * J) % p
-        Z3 = ((Z1 + H) ** 2 - Z1Z1 - HH) % p
+        # (Z1 + H)^2 - Z1Z1 - HH == 2 * Z1 * H
+        Z3 = 2 * Z1 * H % p
+        return X3, Y3, Z3
+
+    def _double_add_mixed(self, X1, Y1, Z1, X2, Y2, p, a):
+        """
+        Add a point to itself and then add an affine point (Z2 == 1) to it.
+
+        Same as _double() followed by _add_mixed(), but without the
+        overhead of the second call and of the intermediate tuple, for use
+        in the multiplication loops.
+
+        (X2, Y2) must not be the point at infinity
+        """
+        if not Y1 or not Z1:
+            return X2, Y2, 1
+        # after:
+        # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#doubling-dbl-2007-bl
+        YY = Y1 * Y1 % p
+        if not YY:
+            return X2, Y2, 1
+        # 2 * ((X1 + YY)^2 - XX - YYYY) == 4 * X1 * YY
+        S = 4 * X1 * YY % p
+        if a:
+            ZZ = Z1 * Z1 % p
+            M = (3 * X1 * X1 + a * ZZ * ZZ) % p
+        else:
+            M = 3 * X1 * X1 % p
+        # (Y1 + Z1)^2 - YY - ZZ == 2 * Y1 * Z1
+        Z1 = 2 * Y1 * Z1 % p
+        X1 = (M * M - 2 * S) % p
+        Y1 = (M * (S - X1) - 8 * YY * YY) % p
+
+        # after:
+        # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-madd-2007-bl
+        Z1Z1 = Z1 * Z1 % p
+        # U2 and S2 are reduced as part of H and r
+        U2, S2 = X2 * Z1Z1, Y2 * Z1 * Z1Z1
+        H = (U2 - X1) % p
+        HH = H * H % p
+        I = 4 * HH
+        J = H * I
+        r = 2 * (S2 - Y1) % p
+        if not r and not H:
+            return self._double_with_z_1(X2, Y2, p, a)
+        V = X1 * I
+        X3 = (r * r - J - 2 * V) % p
+        Y3 = (r * (V - X3) - 2 * Y1 * J) % p
+        # (Z1 + H)^2 - Z1Z1 - HH == 2 * Z1 * H
+        Z3 = 2 * Z1 * H % p
+        return X3, Y3, Z3
+
+    def _double_add_mixed_a_m3(self, X1, Y1, Z1, X2, Y2, p, a):
+        """
+        Add a point to itself and then add an affine point (Z2 == 1) to it,
+        curve with a == -3.
+
+        Same as _double_a_m3() followed by _add_mixed().
+
+        (X2, Y2) must not be the point at infinity
+        """
+        if not Y1 or not Z1:
+            return X2, Y2, 1
+        # after:
+        # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-3.html#doubling-dbl-2001-b
+        delta = Z1 * Z1 % p
+        gamma = Y1 * Y1 % p
+        if not gamma:
+            return X2, Y2, 1
+        beta = X1 * gamma % p
+        # 3 * X1^2 + a * Z1^4 with a == -3
+        alpha = 3 * (X1 - delta) * (X1 + delta) % p
+        # (Y1 + Z1)^2 - gamma - delta == 2 * Y1 * Z1
+        Z1 = 2 * Y1 * Z1 % p
+        X1 = (alpha * alpha - 8 * beta) % p
+        Y1 = (alpha * (4 * beta - X1) - 8 * gamma * gamma) % p
+
+        # after:
+        # http://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-madd-2007-bl
+        Z1Z1 = Z1 * Z1 % p
+        # U2 and S2 are reduced as part of H and r
+        U2, S2 = X2 * Z1Z1, Y2 * Z1 * Z1Z1
+        H = (U2 - X1) % p
+        HH = H * H % p
+        I = 4 * HH
+        J = H * I
+        r = 2 * (S2 - Y1) % p
+        if not r and not H:
+            return self._double_with_z_1(X2, Y2, p, a)
+        V = X1 * I
+        X3 = (r * r - J - 2 * V) % p
+        Y3 = (r * (V - X3) - 2 * Y1 * J) % p
+        # (Z1 + H)^2 - Z1Z1 - HH == 2 * Z1 * H
+        Z3 = 2 * Z1 * H % p
         return X3, Y3, Z3
 
     def _add_with_z_ne(self, X1, Y1, Z1, X2, Y2, Z2, p):
@@ -869,14 +1348,15 @@ class PointJacobi(AbstractPoint):
         S2 = Y2 * Z1 * Z1Z1 % p
         H = U2 - U1
         I = 4 * H * H % p
-        J = H * I % p
+        J = H * I
         r = 2 * (S2 - S1) % p
         if not H and not r:
             return self._double(X1, Y1, Z1, p, self.__curve.a())
         V = U1 * I
         X3 = (r * r - J - 2 * V) % p
         Y3 = (r * (V - X3) - 2 * S1 * J) % p
-        Z3 = ((Z1 + Z2) ** 2 - Z1Z1 - Z2Z2) * H % p
+        # ((Z1 + Z2)^2 - Z1Z1 - Z2Z2) * H == 2 * Z1 * Z2 * H
+        Z3 = 2 * Z1 * Z2 * H % p
 
         return X3, Y3, Z3
 
@@ -890,14 +1370,16 @@ class PointJacobi(AbstractPoint):
             return X2, Y2, Z2
         if not Y2 or not Z2:
             return X1, Y1, Z1
-        if Z1 == Z2:
+        # scalar multiplication adds affine points from the precomputation
+        # tables to the accumulator, so check for Z2 == 1 first
+        if Z2 == 1:
             if Z1 == 1:
                 return self._add_with_z_1(X1, Y1, X2, Y2, p)
+            return self._add_mixed(X1, Y1, Z1, X2, Y2, p)
+        if Z1 == Z2:
             return self._add_with_z_eq(X1, Y1, Z1, X2, Y2, p)
         if Z1 == 1:
-            return self._add_with_z2_1(X2, Y2, Z2, X1, Y1, p)
-        if Z2 == 1:
-            return self._add_with_z2_1(X1, Y1, Z1, X2, Y2, p)
+            return self._add_mixed(X2, Y2, Z2, X1, Y1, p)
         return self._add_with_z_ne(X1, Y1, Z1, X2, Y2, Z2, p)
 
     def __add__(self, other):
@@ -926,23 +1408,27 @@ class PointJacobi(AbstractPoint):
         return self * other
 
     def _mul_precompute(self, other):
-        """Multiply point by integer with precomputation table."""
+        """
+        Multiply point by integer with precomputation table.
+
+        Returns Jacobi coordinates of the result, other needs to be
+        smaller than 2 * order.
+        """
         X3, Y3, Z3, p = 0, 0, 1, self.__curve.p()
-        _add = self._add
-        for X2, Y2 in self.__precompute:
-            if other % 2:
-                if other % 4 >= 2:
-                    other = (other + 1) // 2
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, X2, -Y2, 1, p)
-                else:
-                    other = (other - 1) // 2
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, X2, Y2, 1, p)
-            else:
-                other //= 2
+        _add_mixed = self._add_mixed
+        # every non-zero digit of the width-5 NAF selects one precomputed
+        # odd multiple, so the whole multiplication needs no point doublings
+        # gmp object creation has cumulatively higher overhead than the
+        # speedup we get from calculating the NAF using gmp so ensure use
+        # of int()
+        for digit, row in zip(self._wnaf(int(other), 5), self.__precompute):
+            if not digit:
+                continue
+            # row holds u * 2^i * G for u = +-1, +-3, ..., +-15
+            X2, Y2 = row[digit]
+            X3, Y3, Z3 = _add_mixed(X3, Y3, Z3, X2, Y2, p)
 
-        if not Y3 or not Z3:
-            return INFINITY
-        return PointJacobi(self.__curve, X3, Y3, Z3, self.__order)
+        return X3, Y3, Z3
 
     def __mul__(self, other):
         """Multiply point by an integer."""
@@ -955,27 +1441,128 @@ class PointJacobi(AbstractPoint):
             other = other % (self.__order * 2)
         self._maybe_precompute()
         if self.__precompute:
-            return self._mul_precompute(other)
+            X3, Y3, Z3 = self._mul_precompute(other)
+        elif 0 < other < 16:
+            # for small multipliers neither the scaling of the point nor the
+            # NAF computation pay off
+            X3, Y3, Z3 = self._mul_small(other)
+        else:
+            self.scale()
+            if self.__curve._glv:
+                X3, Y3, Z3 = self._mul_glv(other)
+            else:
+                X3, Y3, Z3 = self._mul_wnaf(other)
 
-        self = self.scale()
-        X2, Y2, _ = self.__coords
-        X3, Y3, Z3 = 0, 0, 1
+        if not Y3 or not Z3:
+            return INFINITY
+
+        return PointJacobi(self.__curve, X3, Y3, Z3, self.__order)
+
+    def _mul_small(self, other):
+        """
+        Multiply point by a small integer, return Jacobi coordinates.
+
+        Uses plain double-and-add, doesn't need the point to be scaled.
+        """
+        X1, Y1, Z1 = self.__coords
         p, a = self.__curve.p(), self.__curve.a()
-        _double = self._double
+        _double = self._doubler()
         _add = self._add
-        # since adding points when at least one of them is scaled
-        # is quicker, reverse the NAF order
-        for i in reversed(self._naf(other)):
+
+        X3, Y3, Z3 = 0, 0, 1
+        for bit in bin(int(other))[2:]:
             X3, Y3, Z3 = _double(X3, Y3, Z3, p, a)
-            if i < 0:
-                X3, Y3, Z3 = _add(X3, Y3, Z3, X2, -Y2, 1, p)
-            elif i > 0:
-                X3, Y3, Z3 = _add(X3, Y3, Z3, X2, Y2, 1, p)
+            if bit == "1":
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X1, Y1, Z1, p)
 
-        if not Y3 or not Z3:
-            return INFINITY
+        return X3, Y3, Z3
 
-        return PointJacobi(self.__curve, X3, Y3, Z3, self.__order)
+    def _mul_wnaf(self, other):
+        """Multiply point by integer, return Jacobi coordinates."""
+        X1, Y1, Z1 = self.__coords
+        p, a = self.__curve.p(), self.__curve.a()
+        _double = self._doubler()
+        _add = self._add
+
+        # odd multiples u * self for u = 1, 3, 5, 7
+        odd = [(X1, Y1, Z1)]
+        X2, Y2, Z2 = _double(X1, Y1, Z1, p, a)
+        for _ in range(3):
+            X1, Y1, Z1 = _add(X1, Y1, Z1, X2, Y2, Z2, p)
+            odd.append((X1, Y1, Z1))
+        # scale them, so that all additions in the loop are the cheap
+        # mixed additions, that's not possible if any of them is the point
+        # at infinity (only for points of very small order)
+        if all(Z for _, _, Z in odd):
+            odd = [(X, Y, 1) for X, Y in self._batch_affine(odd, p)]
+
+        # store the negative multiples at negative indexes, so that
+        # a width-4 NAF digit can be used directly as an index to the table
+        table = [None] * 16
+        for u, (X1, Y1, Z1) in zip(range(1, 8, 2), odd):
+            table[u], table[-u] = (X1, Y1, Z1), (X1, -Y1, Z1)
+        mixed = all(Y and Z == 1 for _, Y, Z in odd)
+        _double_add_mixed = self._double_adder()
+
+        X3, Y3, Z3 = 0, 0, 1
+        # gmp object creation has cumulatively higher overhead than the
+        # speedup we get from calculating the NAF using gmp so ensure use
+        # of int()
+        for digit in reversed(self._wnaf(int(other), 4)):
+            if not digit:
+                X3, Y3, Z3 = _double(X3, Y3, Z3, p, a)
+            elif mixed:
+                X2, Y2, _ = table[digit]
+                X3, Y3, Z3 = _double_add_mixed(X3, Y3, Z3, X2, Y2, p, a)
+            else:
+                X3, Y3, Z3 = _double(X3, Y3, Z3, p, a)
+                X2, Y2, Z2 = table[digit]
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X2, Y2, Z2, p)
+
+        return X3, Y3, Z3
+
+    @staticmethod
+    def _glv_split(k, glv):
+        """
+        Split multiplier to two, half as long, ones.
+
+        Returns k1, k2 such that k1 + k2 * lam == k (mod n), with both
+        of them about half the bit size of n (balanced length-two
+        representation from the GLV paper).
+        """
+        n, _, _, a1, b1, a2, b2 = glv
+        half = n // 2
+        c1 = (b2 * k + half) // n
+        c2 = (-b1 * k + half) // n
+        k1 = k - c1 * a1 - c2 * a2
+        k2 = -c1 * b1 - c2 * b2
+        return k1, k2
+
+    def _mul_glv(self, other):
+        """
+        Multiply scaled point by integer using the curve endomorphism.
+
+        Calculates k1 * self + k2 * (lam * self), where lam * self is
+        cheap to compute and the k1, k2 multipliers are half as long
+        as other, so half of the point doublings are saved.
+        Needs self to be scaled.
+        """
+        glv = self.__curve._glv
+        p = self.__curve.p()
+        k1, k2 = self._glv_split(other, glv)
+        X1, Y1, _ = self.__coords
+        X2, Y2 = glv[2] * X1 % p, Y1
+        if k1 < 0:
+            k1, Y1 = -k1, -Y1 % p
+        if k2 < 0:
+            k2, Y2 = -k2, -Y2 % p
+
+        ret = self._mul_add_jsf(X1, Y1, 1, k1, X2, Y2, 1, k2)
+        if ret is None:
+            # self + lam * self is never the point at infinity for points
+            # of prime order, but don't depend on it
+            return self._mul_wnaf(other)  # pragma: no cover
+        return ret
 
     def mul_add(self, self_mul, other, other_mul):
         """
@@ -994,15 +1581,28 @@ class PointJacobi(AbstractPoint):
         self._maybe_precompute()
         other._maybe_precompute()
         if self.__precompute and other.__precompute:
-            return self * self_mul + other * other_mul
+            # add the results directly, without creating intermediate
+            # PointJacobi objects
+            # order*2 as a protection for Minerva
+            X1, Y1, Z1 = self._mul_precompute(self_mul % (self.__order * 2))
+            X2, Y2, Z2 = other._mul_precompute(other_mul % (other.__order * 2))
+            X3, Y3, Z3 = self._add(X1, Y1, Z1, X2, Y2, Z2, self.__curve.p())
+        else:
+            X3, Y3, Z3 = self._mul_add_jacobi(self_mul, other, other_mul)
+
+        if not Y3 or not Z3:
+            return INFINITY
+
+        return PointJacobi(self.__curve, X3, Y3, Z3, self.__order)
 
+    def _mul_add_jacobi(self, self_mul, other, other_mul):
+        """
+        Calculate self*self_mul + other*other_mul, return Jacobi coordinates.
+        """
         if self.__order:
             self_mul = self_mul % self.__order
-            other_mul = other_mul % self.__order
-
-        # (X3, Y3, Z3) is the accumulator
-        X3, Y3, Z3 = 0, 0, 1
-        p, a = self.__curve.p(), self.__curve.a()
+        if other.__order:
+            other_mul = other_mul % other.__order
 
         # as we have 6 unique points to work with, we can't scale all of them,
         # but do scale the ones that are used most often
@@ -1011,69 +1611,95 @@ class PointJacobi(AbstractPoint):
         other.scale()
         X2, Y2, Z2 = other.__coords
 
-        _double = self._double
-        _add = self._add
+        # JSF needs non-negative multipliers, negate the points instead
+        p = self.__curve.p()
+        k1, k2 = self_mul, other_mul
+        if k1 < 0:
+            k1, Y1 = -k1, -Y1 % p
+        if k2 < 0:
+            k2, Y2 = -k2, -Y2 % p
 
-        # with NAF we have 3 options: no add, subtract, add
-        # so with 2 points, we have 9 combinations:
-        # 0, -A, +A, -B, -A-B, +A-B, +B, -A+B, +A+B
-        # so we need 4 combined points:
-        mAmB_X, mAmB_Y, mAmB_Z = _add(X1, -Y1, Z1, X2, -Y2, Z2, p)
-        pAmB_X, pAmB_Y, pAmB_Z = _add(X1, Y1, Z1, X2, -Y2, Z2, p)
-        mApB_X, mApB_Y, mApB_Z = pAmB_X, -pAmB_Y, pAmB_Z
-        pApB_X, pApB_Y, pApB_Z = mAmB_X, -mAmB_Y, mAmB_Z
+        ret = self._mul_add_jsf(X1, Y1, Z1, k1, X2, Y2, Z2, k2)
         # when the self and other sum to infinity, we need to add them
         # one by one to get correct result but as that's very unlikely to
         # happen in regular operation, we don't need to optimise this case
-        if not pApB_Y or not pApB_Z:
-            return self * self_mul + other * other_mul
+        if ret is None:
+            X1, Y1, Z1 = self._mul_wnaf(self_mul)
+            X2, Y2, Z2 = other._mul_wnaf(other_mul)
+            return self._add(X1, Y1, Z1, X2, Y2, Z2, p)
+        return ret
+
+    def _mul_add_jsf(self, X1, Y1, Z1, self_mul, X2, Y2, Z2, other_mul):
+        """
+        Calculate self_mul * (X1, Y1, Z1) + other_mul * (X2, Y2, Z2).
+
+        Both multiplications share the point doublings. Returns the Jacobi
+        coordinates of the result or None when the sum of the two points
+        is the point at infinity (the method can't handle that case).
+        """
+        # (X3, Y3, Z3) is the accumulator
+        X3, Y3, Z3 = 0, 0, 1
+        p, a = self.__curve.p(), self.__curve.a()
+
+        _double = self._doubler()
+        _add = self._add
+
+        # with JSF we have 3 options: no add, subtract, add
+        # so with 2 points, we have 9 combinations:
+        # 0, -A, +A, -B, -A-B, +A-B, +B, -A+B, +A+B
+        # so we need 4 combined points, two of them are just negations
+        # of the other two:
+        # negate the points just once and keep the coordinates positive,
+        # -Y % p (unlike p - Y) keeps the point at infinity at Y == 0
+        nY1, nY2 = -Y1 % p, -Y2 % p
+        mAmB_X, mAmB_Y, mAmB_Z = _add(X1, nY1, Z1, X2, nY2, Z2, p)
+        pAmB_X, pAmB_Y, pAmB_Z = _add(X1, Y1, Z1, X2, nY2, Z2, p)
+        if not mAmB_Y or not mAmB_Z:
+            return None
+        # A - B is the point at infinity when A == B
+        if pAmB_Z:
+            # scale the combined points so that they can be added to the
+            # accumulator with the cheaper mixed addition, one inversion
+            # for both of them
+            (mAmB_X, mAmB_Y), (pAmB_X, pAmB_Y) = self._batch_affine(
+                [(mAmB_X, mAmB_Y, mAmB_Z), (pAmB_X, pAmB_Y, pAmB_Z)], p
+            )
+            mAmB_Z = pAmB_Z = 1
+        # the table is indexed by 3 * A + B, so the negative combinations
+        # are at the negative indexes (at the end of the list)
+        table = [
+            None,
+            (X2, Y2, Z2),  # +B
+            (pAmB_X, pAmB_Y, pAmB_Z),  # +A-B
+            (X1, Y1, Z1),  # +A
+            (mAmB_X, -mAmB_Y % p, mAmB_Z),  # +A+B
+            (mAmB_X, mAmB_Y, mAmB_Z),  # -A-B
+            (X1, nY1, Z1),  # -A
+            (pAmB_X, -pAmB_Y % p, pAmB_Z),  # -A+B
+            (X2, nY2, Z2),  # -B
+        ]
 
         # gmp object creation has cumulatively higher overhead than the
-        # speedup we get from calculating the NAF using gmp so ensure use
+        # speedup we get from calculating the JSF using gmp so ensure use
         # of int()
-        self_naf = list(reversed(self._naf(int(self_mul))))
-        other_naf = list(reversed(self._naf(int(other_mul))))
-        # ensure that the lists are the same length (zip() will truncate
-        # longer one otherwise)
-        if len(self_naf) < len(other_naf):
-            self_naf = [0] * (len(other_naf) - len(self_naf)) + self_naf
-        elif len(self_naf) > len(other_naf):
-            other_naf = [0] * (len(self_naf) - len(other_naf)) + other_naf
-
-        for A, B in zip(self_naf, other_naf):
-            X3, Y3, Z3 = _double(X3, Y3, Z3, p, a)
-
-            # conditions ordered from most to least likely
-            if A == 0:
-                if B == 0:
-                    pass
-                elif B < 0:
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, X2, -Y2, Z2, p)
-                else:
-                    assert B > 0
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, X2, Y2, Z2, p)
-            elif A < 0:
-                if B == 0:
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, X1, -Y1, Z1, p)
-                elif B < 0:
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, mAmB_X, mAmB_Y, mAmB_Z, p)
-                else:
-                    assert B > 0
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, mApB_X, mApB_Y, mApB_Z, p)
+        # all the points are usually scaled, so that the cheaper mixed
+        # addition can be used
+        mixed = all(Y and Z == 1 for _, Y, Z in table[1:])
+        _double_add_mixed = self._double_adder()
+
+        for A, B in reversed(self._jsf(int(self_mul), int(other_mul))):
+            point = table[3 * A + B]
+            if not point:
+                X3, Y3, Z3 = _double(X3, Y3, Z3, p, a)
+            elif mixed:
+                X4, Y4, _ = point
+                X3, Y3, Z3 = _double_add_mixed(X3, Y3, Z3, X4, Y4, p, a)
             else:
-                assert A > 0
-                if B == 0:
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, X1, Y1, Z1, p)
-                elif B < 0:
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, pAmB_X, pAmB_Y, pAmB_Z, p)
-                else:
-                    assert B > 0
-                    X3, Y3, Z3 = _add(X3, Y3, Z3, pApB_X, pApB_Y, pApB_Z, p)
+                X3, Y3, Z3 = _double(X3, Y3, Z3, p, a)
+                X4, Y4, Z4 = point
+                X3, Y3, Z3 = _add(X3, Y3, Z3, X4, Y4, Z4, p)
 
-        if not Y3 or not Z3:
-            return INFINITY
-
-        return PointJacobi(self.__curve, X3, Y3, Z3, self.__order)
+        return X3, Y3, Z3
 
     def __neg__(self):
         """Return negated point."""
@@ -1217,23 +1843,63 @@ class Point(AbstractPoint):
         if e < 0:
             return (-self) * (-e)
 
-        # From X9.62 D.3.2:
+        if e == 1:
+            return self
+
+        # Jacobi coordinates need just one modular inverse, at the very end,
+        # but they can't represent points of order 2 (y == 0), those can
+        # exist only when the order of the group is even
+        if (self.__order and self.__order % 2) or self.__curve.cofactor() == 1:
+            result = PointJacobi(
+                self.__curve, self.__x, self.__y, 1, self.__order
+            )
+            result = result * e
+            if result == INFINITY:
+                return INFINITY
+            result = result.scale()
+            return Point(self.__curve, result.x(), result.y())
+
+        # From X9.62 D.3.2, with the point operations done on local
+        # variables, so that no intermediate Point objects are created;
+        # None in x3 is the point at infinity
+        p, a = self.__curve.p(), self.__curve.a()
+        inverse_mod = numbertheory.inverse_mod
+        x1, y1 = self.__x, self.__y
+        x3, y3 = x1, y1
 
         e3 = 3 * e
-        negative_self = Point(self.__curve, self.__x, -self.__y, self.__order)
         i = leftmost_bit(e3) // 2
-        result = self
-        # print("Multiplying %s by %d (e3 = %d):" % (self, other, e3))
         while i > 1:
-            result = result.double()
+            if x3 is not None:
+                if y3 % p:
+                    l = (3 * x3 * x3 + a) * inverse_mod(2 * y3, p) % p
+                    x2 = (l * l - 2 * x3) % p
+                    x3, y3 = x2, (l * (x3 - x2) - y3) % p
+                else:
+                    x3 = None
             if (e3 & i) != 0 and (e & i) == 0:
-                result = result + self
-            if (e3 & i) == 0 and (e & i) != 0:
-                result = result + negative_self
-            # print(". . . i = %d, result = %s" % ( i, result ))
+                y2 = y1
+            elif (e3 & i) == 0 and (e & i) != 0:
+                y2 = -y1
+            else:
+                i = i // 2
+                continue
+            if x3 is None:
+                x3, y3 = x1, y2 % p
+            elif x3 != x1:
+                l = (y2 - y3) * inverse_mod(x1 - x3, p) % p
+                x2 = (l * l - x3 - x1) % p
+                x3, y3 = x2, (l * (x3 - x2) - y3) % p
+            elif (y3 + y2) % p == 0:
+                x3 = None
+            else:
+                # adding a point to itself
+                x3, y3 = self._double_affine(x3, y3, p, a)
             i = i // 2
 
-        return result
+        if x3 is None:
+            return INFINITY
+        return Point(self.__curve, x3, y3)
 
     def __rmul__(self, other):
         """Multiply a point by an integer."""
@@ -1251,20 +1917,23 @@ class Point(AbstractPoint):
         if self == INFINITY:
             return INFINITY
 
-        # X9.62 B.3:
+        x3, y3 = self._double_affine(
+            self.__x, self.__y, self.__curve.p(), self.__curve.a()
+        )
 
-        p = self.__curve.p()
-        a = self.__curve.a()
+        return Point(self.__curve, x3, y3)
 
-        l = (
-            (3 * self.__x * self.__x + a)
-            * numbertheory.inverse_mod(2 * self.__y, p)
-        ) % p
+    @staticmethod
+    def _double_affine(x1, y1, p, a):
+        """Add a point to itself, in affine coordinates."""
+        # X9.62 B.3:
 
-        x3 = (l * l - 2 * self.__x) % p
-        y3 = (l * (self.__x - x3) - self.__y) % p
+        l = ((3 * x1 * x1 + a) * numbertheory.inverse_mod(2 * y1, p)) % p
 
-        return Point(self.__curve, x3, y3)
+        x3 = (l * l - 2 * x1) % p
+        y3 = (l * (x1 - x3) - y1) % p
+
+        return x3, y3
 
     def x(self):
         return self.__x
@@ -1297,7 +1966,14 @@ class PointEdwards(AbstractPoint):
         super(PointEdwards, self).__init__()
         self.__curve = curve
         if GMPY:  # pragma: no branch
-            self.__coords = (mpz(x), mpz(y), mpz(z), mpz(t))
+            # coordinates coming from point arithmetic already are mpz
+            # objects, don't spend time on wrapping them again
+            self.__coords = (
+                x if type(x) is _MPZ_TYPE else mpz(x),
+                y if type(y) is _MPZ_TYPE else mpz(y),
+                z if type(z) is _MPZ_TYPE else mpz(z),
+                t if type(t) is _MPZ_TYPE else mpz(t),
+            )
             self.__order = order and mpz(order)
         else:  # pragma: no branch
             self.__coords = (x, y, z, t)
@@ -1305,6 +1981,15 @@ class PointEdwards(AbstractPoint):
         self.__generator = generator
         self.__precompute = []
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # older versions stored the table as a flat list of (x, y, t)
+        # tuples, drop it so that it is recreated in the current layout
+        # when needed
+        precompute = self.__precompute
+        if precompute and not isinstance(precompute[0], list):
+            self.__precompute = []
+
     @classmethod
     def from_bytes(
         cls,
@@ -1359,31 +2044,59 @@ class PointEdwards(AbstractPoint):
         # lead to inconsistent __precompute)
         order = self.__order
         assert order
+        p, a = self.__curve.p(), self.__curve.a()
+        X, Y, Z, T = self.__coords
+        _double = self._doubler()
+        _add = self._add
+        # the multiplier is reduced modulo 2*order (see __mul__), so its
+        # width-5 NAF has at most bit_length(2*order) + 1 digits, for every
+        # digit position i we need the odd multiples u * 2^i * G, u in 1..15
+        rows = bit_length(order * 2) + 1
+        points = []
+
+        for _ in range(rows):
+            # 2 * base is also the base of the next row
+            X2, Y2, Z2, T2 = _double(X, Y, Z, T, p, a)
+            X3, Y3, Z3, T3 = X, Y, Z, T
+            points.append((X3, Y3, Z3))
+            for _ in range(7):
+                X3, Y3, Z3, T3 = _add(X3, Y3, Z3, T3, X2, Y2, Z2, T2, p, a)
+                points.append((X3, Y3, Z3))
+            X, Y, Z, T = X2, Y2, Z2, T2
+
+        # store the table in affine coordinates, so that all the additions
+        # in _mul_precompute() are with points with Z == 1
+        points = self._batch_affine(points, p)
+        # store the negated points at negative indexes, so that a width-5
+        # NAF digit can be used directly as an index to a row
         precompute = []
-        i = 1
-        order *= 2
-        coord_x, coord_y, coord_z, coord_t = self.__coords
-        prime = self.__curve.p()
+        for i in range(0, len(points), 8):
+            row = [None] * 32
+            for u, (x, y, t) in zip(range(1, 16, 2), points[i : i + 8]):
+                row[u], row[-u] = (x, y, t), (p - x, y, p - t)
+            precompute.append(row)
 
-        doubler = PointEdwards(
-            self.__curve, coord_x, coord_y, coord_z, coord_t, order
-        )
-        # for "protection" against Minerva we need 1 or 2 more bits depending
-        # on order bit size, but it's easier to just calculate one
-        # point more always
-        order *= 4
+        self.__precompute = precompute
+        return self.__precompute
 
-        while i < order:
-            doubler = doubler.scale()
-            coord_x, coord_y = doubler.x(), doubler.y()
-            coord_t = coord_x * coord_y % prime
-            precompute.append((coord_x, coord_y, coord_t))
+    @staticmethod
+    def _batch_affine(points, p):
+        """
+        Convert a list of points in extended coordinates to affine ones.
 
-            i *= 2
-            doubler = doubler.double()
+        Uses _batch_inverse(), so the whole conversion needs a single
+        modular inverse and a few multiplications per point.
 
-        self.__precompute = precompute
-        return self.__precompute
+        :param list points: list of (X, Y, Z) tuples
+        :param int p: the field prime
+        :return: list of (x, y, x*y) tuples
+        """
+        z_invs = _batch_inverse([Z for _, _, Z in points], p)
+        ret = []
+        for (X, Y, _), z_inv in zip(points, z_invs):
+            x, y = X * z_inv % p, Y * z_inv % p
+            ret.append((x, y, x * y % p))
+        return ret
 
     def x(self):
         """Return affine x coordinate."""
@@ -1444,12 +2157,14 @@ class PointEdwards(AbstractPoint):
             return False
         p = self.__curve.p()
 
+        # common for points both in affine or with the same scaling
+        if z1 == z2:
+            return (x1 - x2) % p == 0 and (y1 - y2) % p == 0
+
         # cross multiply to eliminate divisions
-        xn1 = x1 * z2 % p
-        xn2 = x2 * z1 % p
-        yn1 = y1 * z2 % p
-        yn2 = y2 * z1 % p
-        return xn1 == xn2 and yn1 == yn2
+        # depend on short-circuit to save 2 multiplications in case of
+        # inequality
+        return (x1 * z2 - x2 * z1) % p == 0 and (y1 * z2 - y2 * z1) % p == 0
 
     def __ne__(self, other):
         """Compare for inequality two points with each-other."""
@@ -1460,13 +2175,14 @@ class PointEdwards(AbstractPoint):
         # after add-2008-hwcd-2
         # from https://hyperelliptic.org/EFD/g1p/auto-twisted-extended.html
         # NOTE: there are more efficient formulas for Z1 or Z2 == 1
-        A = X1 * X2 % p
+        # A is reduced as part of F and G
+        A = X1 * X2
         B = Y1 * Y2 % p
         C = Z1 * T2 % p
         D = T1 * Z2 % p
         E = D + C
         F = ((X1 - Y1) * (X2 + Y2) + B - A) % p
-        G = B + a * A
+        G = (B + a * A) % p
         H = D - C
         if not H:
             return self._double(X1, Y1, Z1, T1, p, a)
@@ -1506,11 +2222,12 @@ class PointEdwards(AbstractPoint):
         # after "dbl-2008-hwcd"
         # from https://hyperelliptic.org/EFD/g1p/auto-twisted-extended.html
         # NOTE: there are more efficient formulas for Z1 == 1
-        A = X1 * X1 % p
+        # A = X1^2 is used only in D = a * A, so it isn't computed separately
         B = Y1 * Y1 % p
         C = 2 * Z1 * Z1 % p
-        D = a * A % p
-        E = ((X1 + Y1) * (X1 + Y1) - A - B) % p
+        D = a * X1 * X1 % p
+        # (X1 + Y1)^2 - A - B == 2 * X1 * Y1
+        E = 2 * X1 * Y1 % p
         G = D + B
         F = G - C
         H = D - B
@@ -1521,6 +2238,122 @@ class PointEdwards(AbstractPoint):
 
         return X3, Y3, Z3, T3
 
+    def _double_a_m1(self, X1, Y1, Z1, T1, p, a):
+        """Double the point, curve with a == -1, assume sane parameters."""
+        # after "dbl-2008-hwcd"
+        # from https://hyperelliptic.org/EFD/g1p/auto-twisted-extended.html
+        # with D = a * A == -A
+        B = Y1 * Y1 % p
+        C = 2 * Z1 * Z1 % p
+        D = -X1 * X1 % p
+        # (X1 + Y1)^2 - A - B == 2 * X1 * Y1
+        E = 2 * X1 * Y1 % p
+        G = D + B
+        F = G - C
+        H = D - B
+        X3 = E * F % p
+        Y3 = G * H % p
+        T3 = E * H % p
+        Z3 = F * G % p
+
+        return X3, Y3, Z3, T3
+
+    def _doubler(self):
+        """Return the fastest doubling method for the curve of the point."""
+        if self.__curve._a_is_minus_1:
+            return self._double_a_m1
+        return self._double
+
+    def _double_add(self, X1, Y1, Z1, T1, X2, Y2, Z2, T2, p, a):
+        """
+        Double the point and add another one to it, assume sane parameters.
+
+        Same as _double() followed by _add(), but without the overhead
+        of the second call and of the intermediate tuple, for use in the
+        multiplication loop.
+        """
+        # after "dbl-2008-hwcd"
+        # A = X1^2 is used only in D = a * A, so it isn't computed separately
+        B = Y1 * Y1 % p
+        C = 2 * Z1 * Z1 % p
+        D = a * X1 * X1 % p
+        # (X1 + Y1)^2 - A - B == 2 * X1 * Y1
+        E = 2 * X1 * Y1 % p
+        G = D + B
+        F = G - C
+        H = D - B
+        X1 = E * F % p
+        Y1 = G * H % p
+        T1 = E * H % p
+        Z1 = F * G % p
+
+        # after add-2008-hwcd-2
+        # A is reduced as part of F and G
+        A = X1 * X2
+        B = Y1 * Y2 % p
+        C = Z1 * T2 % p
+        D = T1 * Z2 % p
+        E = D + C
+        F = ((X1 - Y1) * (X2 + Y2) + B - A) % p
+        G = (B + a * A) % p
+        H = D - C
+        if not H:
+            return self._double(X1, Y1, Z1, T1, p, a)
+        X3 = E * F % p
+        Y3 = G * H % p
+        T3 = E * H % p
+        Z3 = F * G % p
+
+        return X3, Y3, Z3, T3
+
+    def _double_add_a_m1(self, X1, Y1, Z1, T1, X2, Y2, Z2, T2, p, a):
+        """
+        Double the point and add another one to it, curve with a == -1,
+        assume sane parameters.
+        """
+        # after "dbl-2008-hwcd"
+        # with D = a * A == -A
+        B = Y1 * Y1 % p
+        C = 2 * Z1 * Z1 % p
+        D = -X1 * X1 % p
+        # (X1 + Y1)^2 - A - B == 2 * X1 * Y1
+        E = 2 * X1 * Y1 % p
+        G = D + B
+        F = G - C
+        H = D - B
+        X1 = E * F % p
+        Y1 = G * H % p
+        T1 = E * H % p
+        Z1 = F * G % p
+
+        # after add-2008-hwcd-2
+        # A is reduced as part of F and G
+        A = X1 * X2
+        B = Y1 * Y2 % p
+        C = Z1 * T2 % p
+        D = T1 * Z2 % p
+        E = D + C
+        F = ((X1 - Y1) * (X2 + Y2) + B - A) % p
+        G = (B - A) % p
+        H = D - C
+        if not H:
+            return self._double_a_m1(X1, Y1, Z1, T1, p, a)
+        X3 = E * F % p
+        Y3 = G * H % p
+        T3 = E * H % p
+        Z3 = F * G % p
+
+        return X3, Y3, Z3, T3
+
+    def _double_adder(self):
+        """
+        Return the fastest fused doubling and addition method for the curve
+        of the point.
+        """
+        if self.__curve._a_is_minus_1:
+            return self._double_add_a_m1
+        return self._double_add
+
     def double(self):
         """Return point added to itself."""
         X1, Y1, Z1, T1 = self.__coords
@@ -1530,7 +2363,7 @@ class PointEdwards(AbstractPoint):
 
         p, a = self.__curve.p(), self.__curve.a()
 
-        X3, Y3, Z3, T3 = self._double(X1, Y1, Z1, T1, p, a)
+        X3, Y3, Z3, T3 = self._doubler()(X1, Y1, Z1, T1, p, a)
 
         # both Ed25519 and Ed448 have prime order, so no point added to
         # itself will equal zero
@@ -1546,17 +2379,14 @@ class PointEdwards(AbstractPoint):
         """Multiply point by integer with precomputation table."""
         X3, Y3, Z3, T3, p, a = 0, 1, 1, 0, self.__curve.p(), self.__curve.a()
         _add = self._add
-        for X2, Y2, T2 in self.__precompute:
-            rem = other % 4
-            if rem == 0 or rem == 2:
-                other //= 2
-            elif rem == 3:
-                other = (other + 1) // 2
-                X3, Y3, Z3, T3 = _add(X3, Y3, Z3, T3, -X2, Y2, 1, -T2, p, a)
-            else:
-                assert rem == 1
-                other = (other - 1) // 2
-                X3, Y3, Z3, T3 = _add(X3, Y3, Z3, T3, X2, Y2, 1, T2, p, a)
+        # every non-zero digit of the width-5 NAF selects one precomputed
+        # odd multiple, so the whole multiplication needs no point doublings
+        for digit, row in zip(self._wnaf(int(other), 5), self.__precompute):
+            if not digit:
+                continue
+            # row holds u * 2^i * G for u = +-1, +-3, ..., +-15
+            X2, Y2, T2 = row[digit]
+            X3, Y3, Z3, T3 = _add(X3, Y3, Z3, T3, X2, Y2, 1, T2, p, a)
 
         if not X3 or not T3:
             return INFINITY
@@ -1576,17 +2406,30 @@ class PointEdwards(AbstractPoint):
         if self._maybe_precompute():
             return self._mul_precompute(other)
 
-        X3, Y3, Z3, T3 = 0, 1, 1, 0  # INFINITY in extended coordinates
         p, a = self.__curve.p(), self.__curve.a()
-        _double = self._double
+        _double = self._doubler()
         _add = self._add
+        _double_add = self._double_adder()
+
+        # odd multiples u * self for u = 1, 3, 5, 7, with the negative
+        # multiples stored at negative indexes, so that a width-4 NAF
+        # digit can be used directly as an index to the table
+        table = [None] * 16
+        table[1], table[-1] = (X2, Y2, Z2, T2), (-X2, Y2, Z2, -T2)
+        X1, Y1, Z1, T1 = _double(X2, Y2, Z2, T2, p, a)
+        for u in (3, 5, 7):
+            X2, Y2, Z2, T2 = _add(X2, Y2, Z2, T2, X1, Y1, Z1, T1, p, a)
+            table[u], table[-u] = (X2, Y2, Z2, T2), (-X2, Y2, Z2, -T2)
 
-        for i in reversed(self._naf(other)):
-            X3, Y3, Z3, T3 = _double(X3, Y3, Z3, T3, p, a)
-            if i < 0:
-                X3, Y3, Z3, T3 = _add(X3, Y3, Z3, T3, -X2, Y2, Z2, -T2, p, a)
-            elif i > 0:
-                X3, Y3, Z3, T3 = _add(X3, Y3, Z3, T3, X2, Y2, Z2, T2, p, a)
+        X3, Y3, Z3, T3 = 0, 1, 1, 0  # INFINITY in extended coordinates
+        for digit in reversed(self._wnaf(int(other), 4)):
+            if digit:
+                X2, Y2, Z2, T2 = table[digit]
+                X3, Y3, Z3, T3 = _double_add(
+                    X3, Y3, Z3, T3, X2, Y2, Z2, T2, p, a
+                )
+            else:
+                X3, Y3, Z3, T3 = _double(X3, Y3, Z3, T3, p, a)
 
         if not X3 or not T3:
             return INFINITY
@@ -187,8 +187,10 @@ class VerifyingKey(object):
         if you expect to verify hundreds of signatures (or more) using the same
         VerifyingKey object.
 
-        Note: You should call this method only once, this method generates a
-        new precomputation table every time it's called.
+        Note: The precomputation table is kept in the public point. The few
+        most recently computed tables for Weierstrass curves are also kept in
+        a small shared cache, so a VerifyingKey created again for the same
+        public point can reuse the table instead of computing it anew.
 
         :param bool lazy: whether to calculate the precomputation table now
            (if set to False) or if it should be delayed to the time of first
@@ -20,21 +20,14 @@ try:
 except NameError:
     xrange = range
 try:
-    from gmpy2 import powmod, mpz
+    from gmpy2 import invert, mpz
 
     GMPY2 = True
-    GMPY = False
 except ImportError:  # pragma: no branch
     GMPY2 = False
-    try:
-        from gmpy import mpz
 
-        GMPY = True
-    except ImportError:
-        GMPY = False
 
-
-if GMPY2 or GMPY:  # pragma: no branch
+if GMPY2:  # pragma: no branch
     integer_types = tuple(integer_types + (type(mpz(1)),))
 
 
@@ -243,28 +236,11 @@ if GMPY2:  # pragma: no branch
         """Inverse of a mod m."""
         if a == 0:  # pragma: no branch
             return 0
-        return powmod(a, -1, m)
-
-elif GMPY:  # pragma: no branch
-
-    def inverse_mod(a, m):
-        """Inverse of a mod m."""
-        # while libgmp does support inverses modulo, it is accessible
-        # only using the native `pow()` function, and `pow()` in gmpy sanity
-        # checks the parameters before passing them on to underlying
-        # implementation
-        if a == 0:  # pragma: no branch
-            return 0
-        a = mpz(a)
-        m = mpz(m)
-
-        lm, hm = mpz(1), mpz(0)
-        low, high = a % m, m
-        while low > 1:  # pragma: no branch
-            r = high // low
-            lm, low, hm, high = hm - lm * r, high - low * r, lm, low
-
-        return lm % m
+        try:
+            return invert(a, m)
+        except ZeroDivisionError:
+            # make it consistent with pow(a, -1, m)
+            raise ValueError("base is not invertible for the given modulus")
 
 elif sys.version_info >= (3, 8):  # pragma: no branch
 
@@ -87,6 +87,38 @@ def test_ed25519_double():
     assert a != b
 
 
+def test_ed25519_double_with_a_minus_1():
+    assert curve_ed25519._a_is_minus_1
+    assert not curve_ed448._a_is_minus_1
+    g = generator_ed25519
+    p, a = curve_ed25519.p(), curve_ed25519.a()
+    x1, y1, z1, t1 = (g * 3)._PointEdwards__coords
+
+    x2, y2, z2, t2 = g._double_a_m1(x1, y1, z1, t1, p, a)
+    x3, y3, z3, t3 = g._double(x1, y1, z1, t1, p, a)
+
+    assert PointEdwards(curve_ed25519, x2, y2, z2, t2) == g * 6
+    assert PointEdwards(curve_ed25519, x3, y3, z3, t3) == g * 6
+
+
+def test_ed25519_double_add_with_a_minus_1():
+    g = generator_ed25519
+    p, a = curve_ed25519.p(), curve_ed25519.a()
+    x1, y1, z1, t1 = (g * 3)._PointEdwards__coords
+    x2, y2, z2, t2 = g._PointEdwards__coords
+
+    assert g._double_adder() == g._double_add_a_m1
+    x3, y3, z3, t3 = g._double_add_a_m1(x1, y1, z1, t1, x2, y2, z2, t2, p, a)
+    x4, y4, z4, t4 = g._double_add(x1, y1, z1, t1, x2, y2, z2, t2, p, a)
+
+    assert PointEdwards(curve_ed25519, x3, y3, z3, t3) == g * 7
+    assert PointEdwards(curve_ed25519, x4, y4, z4, t4) == g * 7
+
+
+def test_ed448_double_adder():
+    assert generator_ed448._double_adder() == generator_ed448._double_add
+
+
 def test_ed25519_add_as_double():
     a = generator_ed25519
 
@@ -129,6 +161,19 @@ def test_ed25519_eq_with_different_z():
     assert not (a != b)
 
 
+def test_ed25519_eq_with_same_z():
+    x = generator_ed25519.x()
+    y = generator_ed25519.y()
+    p = curve_ed25519.p()
+
+    a = PointEdwards(curve_ed25519, x * 2 % p, y * 2 % p, 2, x * y * 2 % p)
+    b = PointEdwards(curve_ed25519, x * 2 - p, y * 2 + p, 2, x * y * 2)
+    c = PointEdwards(curve_ed25519, p - x * 2 % p, y * 2, 2, x * y * 2)
+
+    assert a == b
+    assert a != c
+
+
 def test_ed25519_eq_against_infinity():
     assert generator_ed25519 != INFINITY
 
@@ -369,11 +414,53 @@ def test_ed25519_mul_custom_point():
     assert z == g * 11
 
 
+def test_ed25519_double_add():
+    g = generator_ed25519
+    p, a = curve_ed25519.p(), curve_ed25519.a()
+    x1, y1, z1, t1 = (g * 3)._PointEdwards__coords
+    x2, y2, z2, t2 = (g * 5)._PointEdwards__coords
+
+    x3, y3, z3, t3 = g._double_add(x1, y1, z1, t1, x2, y2, z2, t2, p, a)
+
+    assert PointEdwards(curve_ed25519, x3, y3, z3, t3) == g * 11
+
+
+def test_ed25519_double_add_as_double():
+    g = generator_ed25519
+    p, a = curve_ed25519.p(), curve_ed25519.a()
+    x1, y1, z1, t1 = g._PointEdwards__coords
+    x2, y2, z2, t2 = (g * 2)._PointEdwards__coords
+
+    x3, y3, z3, t3 = g._double_add(x1, y1, z1, t1, x2, y2, z2, t2, p, a)
+
+    assert PointEdwards(curve_ed25519, x3, y3, z3, t3) == g * 4
+
+
 def test_ed25519_pickle():
     g = generator_ed25519
     assert pickle.loads(pickle.dumps(g)) == g
 
 
+def test_ed25519_unpickle_old_precompute_table():
+    g = generator_ed25519
+    g2 = g * 2
+    # older versions stored the table as a flat list of (x, y, t) tuples
+    x, y = g.x(), g.y()
+    x2, y2 = g2.x(), g2.y()
+    p = g.curve().p()
+    state = dict(g.__dict__)
+    state["_PointEdwards__precompute"] = [
+        (x, y, x * y % p),
+        (x2, y2, x2 * y2 % p),
+    ]
+    point = PointEdwards.__new__(PointEdwards)
+
+    point.__setstate__(state)
+
+    assert point * 5 == g * 5
+    assert point * 12345 == g * 12345
+
+
 def test_ed448_eq_against_different_curve():
     assert generator_ed25519 != generator_ed448
 
@@ -718,6 +805,9 @@ def test_ed448_encode_decode(multiple):
 @settings(**HYP_SETTINGS)
 @example(1)
 @example(2)
+@example(int(generator_ed25519.order()) - 1)
+@example(int(generator_ed25519.order()) + 1)
+@example(int(generator_ed25519.order()) * 2 - 1)
 @given(st.integers(min_value=1, max_value=int(generator_ed25519.order()) - 1))
 def test_ed25519_mul_precompute_vs_naf(multiple):
     """Compare multiplication with and without precomputation."""
@@ -727,6 +817,18 @@ def test_ed25519_mul_precompute_vs_naf(multiple):
     assert g * multiple == multiple * new_g
 
 
+@settings(**HYP_SETTINGS)
+@example(1)
+@example(int(generator_ed448.order()) - 1)
+@given(st.integers(min_value=1, max_value=int(generator_ed448.order()) - 1))
+def test_ed448_mul_precompute_vs_naf(multiple):
+    """Compare multiplication with and without precomputation."""
+    g = generator_ed448
+    new_g = PointEdwards(curve_ed448, g.x(), g.y(), 1, g.x() * g.y())
+
+    assert g * multiple == multiple * new_g
+
+
 # Test vectors from RFC 8032
 TEST_VECTORS = [
     # TEST 1
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 
 try:
@@ -71,6 +72,22 @@ def test_add_and_mult_equivalence(p, m, check):
     assert p * m == check
 
 
+@pytest.mark.parametrize(
+    "p, m, check",
+    [
+        (point, n, exp)
+        for point in (
+            Point(c_23, 13, 7),
+            Point(c_23, 3, 10),
+            Point(c_23, 4, 0),
+        )
+        for n, exp in enumerate(add_n_times(point, 30))
+    ],
+)
+def test_add_and_mult_equivalence_without_order(p, m, check):
+    assert p * m == check
+
+
 class TestCurve(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -89,6 +106,51 @@ class TestCurve(unittest.TestCase):
     def test_hashability_curves(self):
         hash(self.c_23)
 
+    def test_unreduced_parameters_curves(self):
+        c = CurveFp(23, 1 - 23, 1 + 46)
+        self.assertEqual(c, self.c_23)
+        self.assertEqual(hash(c), hash(self.c_23))
+        self.assertEqual(c.a(), 1)
+        self.assertEqual(c.b(), 1)
+
+    def test_pickle_curves(self):
+        c = CurveFp(23, -3, 1)
+        self.assertTrue(c._a_is_minus_3)
+        self.assertEqual(pickle.loads(pickle.dumps(c)), c)
+        self.assertTrue(pickle.loads(pickle.dumps(c))._a_is_minus_3)
+
+    def test_unpickle_curve_without_derived_attributes(self):
+        # older versions didn't store the _a_is_minus_3 flag
+        state = dict(CurveFp(23, -3, 1).__dict__)
+        del state["_a_is_minus_3"]
+        c = CurveFp.__new__(CurveFp)
+
+        c.__setstate__(state)
+
+        self.assertTrue(c._a_is_minus_3)
+
+    def test_unpickle_curve_without_glv_parameters(self):
+        # older versions didn't store the endomorphism parameters
+        state = dict(self.c_23.__dict__)
+        del state["_glv"]
+        c = CurveFp.__new__(CurveFp)
+
+        c.__setstate__(state)
+
+        self.assertIsNone(c._glv)
+
+    def test_unpickle_curve_with_unreduced_parameters(self):
+        # older versions stored the parameters as provided
+        state = dict(self.c_23.__dict__)
+        state["_CurveFp__a"] = 1 - 23
+        state["_CurveFp__b"] = 1 + 23
+        c = CurveFp.__new__(CurveFp)
+
+        c.__setstate__(state)
+
+        self.assertEqual(c, self.c_23)
+        self.assertEqual(hash(c), hash(self.c_23))
+
     def test_conflation_curves(self):
         ne1, ne2, ne3 = CurveFp(24, 1, 1), CurveFp(23, 2, 1), CurveFp(23, 1, 2)
         eq1, eq2, eq3 = CurveFp(23, 1, 1), CurveFp(23, 1, 1), self.c_23
@@ -123,6 +185,34 @@ class TestCurveEdTw(unittest.TestCase):
     def test_hashability_curves(self):
         hash(self.c_23)
 
+    def test_unreduced_parameters_curves(self):
+        c = CurveEdTw(23, 1 - 23, 1 + 46)
+        self.assertEqual(c, self.c_23)
+        self.assertEqual(hash(c), hash(self.c_23))
+
+    def test_unpickle_curve_without_derived_attributes(self):
+        # older versions didn't store the a == -1 flag
+        c_m1 = CurveEdTw(23, -1, 1)
+        state = dict(c_m1.__dict__)
+        del state["_a_is_minus_1"]
+        c = CurveEdTw.__new__(CurveEdTw)
+
+        c.__setstate__(state)
+
+        self.assertTrue(c._a_is_minus_1)
+
+    def test_unpickle_curve_with_unreduced_parameters(self):
+        # older versions stored the parameters as provided
+        state = dict(self.c_23.__dict__)
+        state["_CurveEdTw__a"] = 1 - 23
+        state["_CurveEdTw__d"] = 1 + 23
+        c = CurveEdTw.__new__(CurveEdTw)
+
+        c.__setstate__(state)
+
+        self.assertEqual(c, self.c_23)
+        self.assertEqual(hash(c), hash(self.c_23))
+
 
 class TestPoint(unittest.TestCase):
     @classmethod
@@ -247,6 +337,16 @@ class TestPoint(unittest.TestCase):
 
         self.assertEqual(p * -5, (-p) * 5)
 
+    def test_mul_without_order_on_prime_order_curve(self):
+        c192 = CurveFp(self.c192.p(), self.c192.a(), self.c192.b(), 1)
+        p = Point(c192, self.p192.x(), self.p192.y())
+
+        q = p * 12345
+        r = self.p192 * 12345
+
+        self.assertEqual((q.x(), q.y()), (r.x(), r.y()))
+        self.assertIsNone(q.order())
+
     def test_str_infinity(self):
         self.assertEqual(str(INFINITY), "infinity")
 
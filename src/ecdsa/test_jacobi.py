@@ -14,7 +14,14 @@ import platform
 import hypothesis.strategies as st
 from hypothesis import given, assume, settings, example
 
-from .ellipticcurve import CurveFp, PointJacobi, INFINITY
+from .ellipticcurve import (
+    CurveFp,
+    PointJacobi,
+    INFINITY,
+    GMPY,
+    _PrecomputeCache,
+    _batch_inverse,
+)
 from .ecdsa import (
     generator_256,
     curve_256,
@@ -23,9 +30,12 @@ from .ecdsa import (
     curve_brainpoolp160r1,
     generator_112r2,
     curve_112r2,
+    generator_secp256k1,
+    curve_secp256k1,
 )
 from .numbertheory import inverse_mod
 from .util import randrange
+from ._compat import bit_length
 
 
 NO_OLD_SETTINGS = {}
@@ -157,6 +167,42 @@ class TestJacobi(unittest.TestCase):
 
         self.assertIs(pj, INFINITY)
 
+    def test_multiply_by_twice_the_order(self):
+        pj = PointJacobi.from_affine(generator_256)
+
+        pj = pj * (generator_256.order() * 2)
+
+        self.assertIs(pj, INFINITY)
+
+    @given(st.integers(min_value=2, max_value=15))
+    def test_multiply_unscaled_point_by_small_number(self, mul):
+        pj = PointJacobi.from_affine(generator_256).double()
+        self.assertNotEqual(pj._PointJacobi__coords[2], 1)
+
+        ret = pj * mul
+
+        self.assertEqual(ret, generator_256 * (2 * mul))
+        # the multiplication didn't scale the point in place
+        self.assertNotEqual(pj._PointJacobi__coords[2], 1)
+
+    @given(
+        st.sampled_from([generator_256, generator_secp256k1]),
+        st.one_of(
+            st.integers(min_value=1, max_value=20),
+            st.integers(min_value=1, max_value=2**200),
+        ),
+    )
+    @example(generator_256, 1)
+    @example(generator_256, 5)
+    @example(generator_secp256k1, 15)
+    @example(generator_256, 2**200 + 7)
+    def test_multiply_point_without_order_by_negative_number(self, gen, mul):
+        pj = PointJacobi(gen.curve(), gen.x(), gen.y(), 1)
+
+        ret = pj * -mul
+
+        self.assertEqual(ret, -(gen * mul))
+
     def test_zero_point_multiply_by_one(self):
         pj = PointJacobi(curve_256, 0, 0, 1)
 
@@ -240,6 +286,196 @@ class TestJacobi(unittest.TestCase):
 
         self.assertEqual(a, b)
 
+    def test_precompute_shared_between_instances(self):
+        # don't use the module level generator, its table may have been
+        # evicted from the cache already
+        gen = PointJacobi.from_affine(generator_brainpoolp160r1, True)
+        gen * 2
+        self.assertTrue(gen._PointJacobi__precompute)
+
+        # same point, but in different Jacobi representation
+        pj = PointJacobi(
+            gen.curve(),
+            gen.x() * 4 % gen.curve().p(),
+            gen.y() * 8 % gen.curve().p(),
+            2,
+            gen.order(),
+            True,
+        )
+        pj * 2
+
+        self.assertIs(
+            pj._PointJacobi__precompute, gen._PointJacobi__precompute
+        )
+        self.assertEqual(pj * 3, gen * 3)
+
+    def test_precompute_cache_eviction(self):
+        cache = _PrecomputeCache(2)
+        self.assertIs(cache.put(1, [1]), cache.get(1))
+        cache.put(2, [2])
+        # refresh the first entry so that the second one is evicted
+        cache.get(1)
+        cache.put(3, [3])
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(1), [1])
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), [3])
+        # first put wins
+        self.assertEqual(cache.put(3, [4]), [3])
+
+    def test_batch_inverse(self):
+        p = curve_256.p()
+        values = [1, 2, p - 1, generator_256.x(), generator_256.y()]
+
+        inverses = _batch_inverse(values, p)
+
+        self.assertEqual(len(inverses), len(values))
+        for value, inverse in zip(values, inverses):
+            self.assertEqual(value * inverse % p, 1)
+
+    def test_batch_inverse_of_empty_list(self):
+        self.assertEqual(_batch_inverse([], 23), [])
+
+    @given(st.integers(min_value=0, max_value=2**300))
+    @example(0)
+    @example(2**160 - 1)
+    @example(2**160 + 1)
+    def test_wnaf(self, mult):
+        naf = PointJacobi._wnaf(mult, 5)
+
+        self.assertEqual(sum(d * 2**i for i, d in enumerate(naf)), mult)
+        # no leading zeros
+        self.assertTrue(not naf or naf[-1])
+        for i, d in enumerate(naf):
+            if d:
+                self.assertTrue(d % 2)
+                self.assertLess(abs(d), 16)
+                self.assertFalse(any(naf[i + 1 : i + 5]))
+
+    @given(
+        st.integers(min_value=0, max_value=2**300),
+        st.integers(min_value=0, max_value=2**300),
+    )
+    @example(0, 0)
+    @example(0, 1)
+    @example(2**160 - 1, 1)
+    def test_jsf(self, mult0, mult1):
+        jsf = PointJacobi._jsf(mult0, mult1)
+
+        self.assertEqual(
+            sum(u0 * 2**i for i, (u0, _) in enumerate(jsf)), mult0
+        )
+        self.assertEqual(
+            sum(u1 * 2**i for i, (_, u1) in enumerate(jsf)), mult1
+        )
+        self.assertLessEqual(
+            len(jsf), max(bit_length(mult0), bit_length(mult1)) + 1
+        )
+        for u0, u1 in jsf:
+            self.assertIn(u0, (-1, 0, 1))
+            self.assertIn(u1, (-1, 0, 1))
+        # of any three consecutive columns at least one is all zero
+        for i in range(len(jsf) - 2):
+            self.assertIn((0, 0), jsf[i : i + 3])
+
+    def test_mul_of_point_with_small_order(self):
+        # the point has order 7, so 7 * P, one of the odd multiples used
+        # in the multiplication, is the point at infinity
+        curve = CurveFp(23, 1, 1)
+        pj = PointJacobi(curve, 13, 7, 1)
+
+        expected = INFINITY
+        for mult in range(1, 30):
+            expected = expected + pj
+            self.assertEqual(pj * mult, expected)
+
+    @given(st.integers(min_value=0, max_value=2**300))
+    @example(0)
+    @example(int(generator_secp256k1.order()) - 1)
+    def test_glv_split(self, mult):
+        glv = curve_secp256k1._glv
+        n, lam = glv[0], glv[1]
+
+        k1, k2 = PointJacobi._glv_split(mult, glv)
+
+        self.assertEqual((k1 + k2 * lam - mult) % n, 0)
+        if mult < n:
+            self.assertLessEqual(bit_length(abs(k1)), 129)
+            self.assertLessEqual(bit_length(abs(k2)), 129)
+
+    @settings(**SLOW_SETTINGS)
+    @given(
+        st.integers(min_value=1, max_value=int(generator_secp256k1.order())),
+        st.booleans(),
+    )
+    @example(1, True)
+    @example(int(generator_secp256k1.order()) - 1, True)
+    @example(int(generator_secp256k1.order()) - 1, False)
+    def test_mul_with_glv(self, mult, with_order):
+        gen = generator_secp256k1
+        order = gen.order() if with_order else None
+        plain_curve = CurveFp(
+            curve_secp256k1.p(), curve_secp256k1.a(), curve_secp256k1.b(), 1
+        )
+        glv_point = PointJacobi(curve_secp256k1, gen.x(), gen.y(), 1, order)
+        plain_point = PointJacobi(plain_curve, gen.x(), gen.y(), 1, order)
+
+        a = glv_point * mult
+        b = plain_point * mult
+
+        self.assertEqual(a, b)
+
+    def test_mul_with_glv_of_point_at_infinity(self):
+        pj = PointJacobi(curve_secp256k1, 1, 2, 0)
+        glv = curve_secp256k1._glv
+
+        # multipliers that split into k1 and k2 with opposite signs
+        for mult in (2**240 + 12345, 7 * 2**240 + 12345):
+            k1, k2 = PointJacobi._glv_split(mult, glv)
+            self.assertNotEqual(k1 < 0, k2 < 0)
+
+            self.assertEqual(pj * mult, INFINITY)
+
+    @settings(**SLOW_SETTINGS)
+    @given(
+        st.integers(min_value=1, max_value=int(generator_256.order() - 1)),
+        st.integers(min_value=2, max_value=int(curve_256.p() - 1)),
+    )
+    def test_double_with_a_minus_3(self, mul, new_z):
+        self.assertTrue(curve_256._a_is_minus_3)
+        a = PointJacobi.from_affine(generator_256 * mul)
+        p = curve_256.p()
+        new_zz = new_z * new_z % p
+        x, y = a.x() * new_zz % p, a.y() * new_zz * new_z % p
+
+        ret = a._double_a_m3(x, y, new_z, p, curve_256.a())
+
+        self.assertEqual(
+            PointJacobi(curve_256, *ret), generator_256 * (2 * mul)
+        )
+
+    @settings(**SLOW_SETTINGS)
+    @given(
+        st.integers(
+            min_value=1, max_value=int(generator_secp256k1.order() - 1)
+        ),
+        st.integers(min_value=2, max_value=int(curve_secp256k1.p() - 1)),
+    )
+    def test_double_with_a_0(self, mul, new_z):
+        self.assertEqual(curve_secp256k1.a(), 0)
+        a = PointJacobi.from_affine(generator_secp256k1 * mul)
+        p = curve_secp256k1.p()
+        new_zz = new_z * new_z % p
+        x, y = a.x() * new_zz % p, a.y() * new_zz * new_z % p
+
+        ret = a._double_a_0(x, y, new_z, p, curve_secp256k1.a())
+
+        self.assertEqual(
+            PointJacobi(curve_secp256k1, *ret),
+            generator_secp256k1 * (2 * mul),
+        )
+
     @settings(**SLOW_SETTINGS)
     @given(
         st.integers(
@@ -520,6 +756,40 @@ class TestJacobi(unittest.TestCase):
 
         self.assertEqual(j_g, j_g.mul_add(1, INFINITY, 1))
 
+    def test_mul_add_with_self_at_infinity(self):
+        for gen in (generator_256, generator_secp256k1):
+            j_g = PointJacobi.from_affine(gen)
+            inf = PointJacobi(gen.curve(), 0, 0, 1)
+
+            self.assertEqual(inf.mul_add(3, j_g, 5), j_g * 5)
+
+    def test_mul_add_with_self_at_infinity_and_negative_multipliers(self):
+        for gen in (generator_256, generator_secp256k1):
+            j_g = PointJacobi.from_affine(gen)
+            inf = PointJacobi(gen.curve(), 0, 0, 1)
+
+            self.assertEqual(inf.mul_add(-3, j_g, 5), j_g * 5)
+            self.assertEqual(inf.mul_add(3, j_g, -5), j_g * -5)
+            self.assertEqual(inf.mul_add(-3, j_g, -5), j_g * -5)
+
+    def test_mul_add_with_other_at_infinity_and_negative_multipliers(self):
+        for gen in (generator_256, generator_secp256k1):
+            j_g = PointJacobi.from_affine(gen)
+            inf = PointJacobi(gen.curve(), 0, 0, 1)
+
+            self.assertEqual(j_g.mul_add(-3, inf, 5), j_g * -3)
+            self.assertEqual(j_g.mul_add(3, inf, -5), j_g * 3)
+
+    def test_mul_add_jsf_with_point_at_infinity(self):
+        j_g = PointJacobi.from_affine(generator_256)
+        x, y = j_g.x(), j_g.y()
+
+        ret = j_g._mul_add_jsf(x, y, 1, 3, 0, 0, 1, 5)
+        self.assertEqual(PointJacobi(curve_256, *ret), j_g * 3)
+
+        ret = j_g._mul_add_jsf(0, 0, 1, 3, x, y, 1, 5)
+        self.assertEqual(PointJacobi(curve_256, *ret), j_g * 5)
+
     def test_mul_add_same(self):
         j_g = PointJacobi.from_affine(generator_256)
 
@@ -612,6 +882,31 @@ class TestJacobi(unittest.TestCase):
 
         self.assertEqual(j_g.mul_add(order % 34, b, order // 34), INFINITY)
 
+    @given(
+        st.integers(min_value=-(2**256), max_value=2**256),
+        st.integers(min_value=-(2**256), max_value=2**256),
+    )
+    @example(-3, 5)
+    @example(3, -5)
+    @example(-1, -1)
+    def test_mul_add_without_order_with_negative_multipliers(self, m1, m2):
+        j_g = PointJacobi(curve_256, generator_256.x(), generator_256.y(), 1)
+        w_b = generator_256 * 34
+        b = PointJacobi(curve_256, w_b.x(), w_b.y(), 1)
+
+        ret = j_g.mul_add(m1, b, m2)
+
+        self.assertEqual(ret, generator_256 * (m1 + 34 * m2))
+
+    def test_mul_add_with_other_order_only(self):
+        j_g = PointJacobi(curve_256, generator_256.x(), generator_256.y(), 1)
+        order = generator_256.order()
+        b = PointJacobi.from_affine(generator_256 * 34)
+
+        ret = j_g.mul_add(3, b, order * 2**64 + 5)
+
+        self.assertEqual(ret, generator_256 * (3 + 34 * 5))
+
     def test_mul_add_with_doubled_negation_of_itself(self):
         j_g = PointJacobi.from_affine(generator_256 * 17)
 
@@ -624,6 +919,22 @@ class TestJacobi(unittest.TestCase):
         pj2 = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=1, order=1)
         self.assertEqual(pj1, pj2)
 
+    def test_equality_with_same_z_and_unreduced_coordinates(self):
+        pj1 = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=2, order=1)
+        pj2 = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=25, y=-20, z=2)
+        pj3 = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=20, z=2)
+        self.assertEqual(pj1, pj2)
+        self.assertNotEqual(pj1, pj3)
+
+    def test_equality_of_points_at_infinity(self):
+        curve = CurveFp(23, 1, 1, 1)
+        pj1 = PointJacobi(curve, 1, 2, 0)
+        pj2 = PointJacobi(curve, 3, 4, 0)
+        pj3 = PointJacobi(curve, 3, 4, 1)
+        self.assertEqual(pj1, pj2)
+        self.assertNotEqual(pj1, pj3)
+        self.assertNotEqual(pj3, pj1)
+
     def test_equality_with_invalid_object(self):
         j_g = PointJacobi.from_affine(generator_256)
 
@@ -641,10 +952,105 @@ class TestJacobi(unittest.TestCase):
 
         self.assertEqual((x, y, z), (2, 3, 1))
 
+    def test_add_mixed_to_point_at_infinity(self):
+        pj1 = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=1, order=1)
+        x, y, z = pj1._add_mixed(0, 0, 1, 5, 5, 23)
+
+        self.assertEqual((x, y, z), (5, 5, 1))
+
+    @settings(**SLOW_SETTINGS)
+    @given(
+        st.sampled_from(
+            [generator_256, generator_secp256k1, generator_brainpoolp160r1]
+        ),
+        st.integers(min_value=1, max_value=2**64),
+        st.integers(min_value=1, max_value=2**64),
+        st.integers(min_value=2, max_value=2**64),
+    )
+    @example(generator_256, 1, 2, 2)
+    @example(generator_256, 1, 2, 3)
+    @example(generator_secp256k1, 1, 2, 2)
+    @example(generator_brainpoolp160r1, 1, 2, 2)
+    def test_double_add_mixed(self, gen, mul1, mul2, new_z):
+        curve = gen.curve()
+        p, a = curve.p(), curve.a()
+        pj1 = PointJacobi.from_affine(gen) * mul1
+        x1, y1, z1 = pj1.x(), pj1.y(), 1
+        z1, x1, y1 = new_z, x1 * new_z**2 % p, y1 * new_z**3 % p
+        pj2 = PointJacobi.from_affine(gen * mul2)
+
+        ret = pj1._double_adder()(x1, y1, z1, pj2.x(), pj2.y(), p, a)
+
+        self.assertEqual(PointJacobi(curve, *ret), gen * (2 * mul1 + mul2))
+
+    def test_double_add_mixed_to_point_at_infinity(self):
+        pj1 = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=1, order=1)
+        x, y, z = pj1._double_add_mixed(0, 0, 1, 5, 5, 23, 1)
+
+        self.assertEqual((x, y, z), (5, 5, 1))
+
+    @pytest.mark.skipif(not GMPY, reason="requires gmpy2")
+    def test_mpz_coordinates_are_not_wrapped_again(self):
+        x, y = generator_256.x(), generator_256.y()
+
+        pj = PointJacobi(curve_256, x, y, 1)
+
+        self.assertIs(pj._PointJacobi__coords[0], x)
+        self.assertIs(pj._PointJacobi__coords[1], y)
+
     def test_pickle(self):
         pj = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=1, order=1)
         self.assertEqual(pickle.loads(pickle.dumps(pj)), pj)
 
+    def test_pickle_generator_without_precompute_table(self):
+        gen = PointJacobi(
+            curve_256,
+            generator_256.x(),
+            generator_256.y(),
+            1,
+            generator_256.order(),
+            generator=True,
+        )
+        gen * 2
+
+        data = pickle.dumps(gen)
+
+        # the table alone is hundreds of kilobytes
+        self.assertLess(len(data), 1000)
+        self.assertEqual(pickle.loads(data) * 12345, generator_256 * 12345)
+
+    def test_unpickle_generator_with_old_precompute_table(self):
+        # generator on CurveFp(1019, -3, 2, 1) with a filled precomputation
+        # table, pickled by an older version that stored it as a flat
+        # list of (x, y) tuples
+        data = (
+            b"\x80\x02cecdsa.ellipticcurve\nPointJacobi\nq\x00)\x81q\x01}q"
+            b"\x02(X\x13\x00\x00\x00_PointJacobi__curveq\x03cecdsa.ellipt"
+            b"iccurve\nCurveFp\nq\x04)\x81q\x05}q\x06(X\x0b\x00\x00\x00_C"
+            b"urveFp__pq\x07M\xfb\x03X\x0b\x00\x00\x00_CurveFp__aq\x08J"
+            b"\xfd\xff\xff\xffX\x0b\x00\x00\x00_CurveFp__bq\tK\x02X\x0b"
+            b"\x00\x00\x00_CurveFp__hq\nK\x01ubX\x14\x00\x00\x00_PointJ"
+            b"acobi__coordsq\x0bK\x02K\x02K\x01\x87q\x0cX\x13\x00\x00\x00"
+            b"_PointJacobi__orderq\rM\xfb\x03X\x17\x00\x00\x00_PointJaco"
+            b"bi__generatorq\x0e\x88X\x18\x00\x00\x00_PointJacobi__preco"
+            b"mputeq\x0f]q\x10(K\x02K\x02\x86q\x11M=\x03M\xae\x01\x86q"
+            b"\x12K\x82M\xcc\x01\x86q\x13K\xd4K{\x86q\x14M\x16\x01M\xbf"
+            b"\x03\x86q\x15M9\x02K\x89\x86q\x16M\x92\x02M\x9d\x01\x86q"
+            b"\x17M`\x02M^\x03\x86q\x18KrM\x10\x02\x86q\x19M%\x02M.\x03"
+            b"\x86q\x1aMm\x03KK\x86q\x1bM\xee\x01M\xb0\x02\x86q\x1cM\xcf"
+            b"\x01M\xb2\x01\x86q\x1deub."
+        )
+        curve = CurveFp(1019, -3, 2, 1)
+        gen = PointJacobi(curve, 2, 2, 1, 1019)
+
+        pj = pickle.loads(data)
+
+        self.assertEqual(pj, gen)
+        self.assertEqual(pj.curve().a(), 1016)
+        self.assertEqual(pj * 5, gen * 5)
+        self.assertEqual(pj * 1000, gen * 1000)
+        self.assertEqual(pj.double(), gen.double())
+
     @pytest.mark.slow
     @settings(**NO_OLD_SETTINGS)
     @pytest.mark.skipif(
@@ -32,13 +32,13 @@ from .numbertheory import (
 
 try:
     from gmpy2 import mpz
+
+    GMPY = True
 except ImportError:
-    try:
-        from gmpy import mpz
-    except ImportError:
+    GMPY = False
 
-        def mpz(x):
-            return x
+    def mpz(x):
+        return x
 
 
 BIGPRIMES = (
@@ -481,3 +481,11 @@ class TestNumbertheory(unittest.TestCase):
 
     def test_inverse_mod_with_zero(self):
         assert 0 == inverse_mod(0, 11)
+
+    @pytest.mark.skipif(
+        not GMPY and sys.version_info < (3, 8),
+        reason="the fallback implementation doesn't check for inverse",
+    )
+    def test_inverse_mod_of_non_invertible(self):
+        with pytest.raises(ValueError):
+            inverse_mod(2, 4)
@@ -9,12 +9,7 @@ try:
 
     GMPY = True
 except ImportError:  # pragma: no cover
-    try:
-        from gmpy import mpz
-
-        GMPY = True
-    except ImportError:
-        GMPY = False
+    GMPY = False
 
 from ._sha3 import shake_256
 from ._compat import bytes_to_int, int_to_bytes
@@ -43,7 +38,7 @@ class TestBytesToInt(unittest.TestCase):
             int_to_bytes(0, byteorder="middle")
 
 
-@pytest.mark.skipif(GMPY == False, reason="requires gmpy or gmpy2")
+@pytest.mark.skipif(GMPY == False, reason="requires gmpy2")
 def test_int_to_bytes_with_gmpy():
     assert int_to_bytes(mpz(1)) == b"\x01"
 